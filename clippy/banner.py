@@ -5,16 +5,6 @@ import sys
 
 from clippy.theme import THEME, enable_windows_vt  # type: ignore
 
-_VT_ENABLED = False
-
-
-def _enable_windows_vt():
-    global _VT_ENABLED
-    if _VT_ENABLED:
-        return
-    enable_windows_vt()
-    _VT_ENABLED = True
-
 
 def show_banner(force: bool = False):
     """Print a hacker-style ASCII banner once at program start.
@@ -27,7 +17,7 @@ def show_banner(force: bool = False):
         return
     if not force and not sys.stdout.isatty():
         return
-    _enable_windows_vt()
+    enable_windows_vt()
 
     lines = [
         r"       .__  .__                                       ",
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import time
 from typing import Optional
 
 # ---------------------------------------------------------------------------
@@ -32,7 +33,7 @@ _VT_ENABLED = False
 
 
 def _ensure_vt() -> None:
-    """Enable Windows VT processing once."""
+    """Enable Windows VT processing once (skips the theme import after that)."""
     global _VT_ENABLED
     if _VT_ENABLED:
         return
@@ -58,6 +59,24 @@ def _get_theme():
     return _THEME if _THEME is not False else None
 
 
+def refresh_theme() -> None:
+    """Re-read THEME and re-render everything styled from it.
+
+    Needed after replacing ``clippy.theme.THEME`` or switching the chalk colour
+    mode at runtime; the prefixes and label/value styles are cached otherwise.
+    """
+    global _THEME, _PREFIXES
+    _THEME = None
+    _PREFIXES = (_UNSET, {})
+    try:
+        import clippy.utils as _utils
+    except Exception:  # optional styling helpers
+        return
+    # utils bound THEME by name at import; point it at the current object.
+    _utils.THEME = _get_theme()
+    _utils.invalidate_theme_cache()
+
+
 # ---------------------------------------------------------------------------
 # Mapping from old numeric levels to stdlib levels
 # ---------------------------------------------------------------------------
@@ -73,6 +92,114 @@ _OLD_LEVEL_MAP = {
 _CLIPPY_SUBLEVEL = "clippy_sublevel"
 
 
+def _env_min_level() -> int:
+    """``CLIPPY_LOG_LEVEL``: lowest sub-level ``log()`` emits (0, the default, shows all)."""
+    try:
+        return int(os.environ.get("CLIPPY_LOG_LEVEL", "") or 0)
+    except ValueError:
+        return 0
+
+
+# Read once: log() is called per line and the setting can't change mid-run.
+_MIN_LEVEL = _env_min_level()
+
+# Sub-level -> (prefix glyph, Theme style it is drawn in). 0 and anything
+# unknown get a plain two-space indent instead.
+_LEVEL_GLYPH = {1: ("\u2022", "symbol"), 2: ("\u203a", "symbol"), 5: ("\u2716", "error")}
+
+# Uncoloured prefixes by sub-level, for output that isn't a colour terminal.
+_PLAIN_PREFIX = {key: glyph + " " for key, (glyph, _style) in _LEVEL_GLYPH.items()}
+
+
+_UNSET = object()
+# (theme they were rendered with, sub-level -> styled prefix); see refresh_theme().
+_PREFIXES: tuple = (_UNSET, {})
+
+
+def _level_prefix(key: Optional[int], theme) -> str:
+    """Themed prefix (glyph plus space) for sub-level *key*.
+
+    The glyphs never change, so they are rendered once per theme.
+    """
+    global _PREFIXES
+    rendered_for, prefixes = _PREFIXES
+    if rendered_for is not theme:
+        prefixes = {
+            k: _render_prefix(glyph, style, theme) for k, (glyph, style) in _LEVEL_GLYPH.items()
+        }
+        _PREFIXES = (theme, prefixes)
+    return prefixes.get(key, "  ")
+
+
+def _render_prefix(glyph: str, style: str, theme) -> str:
+    try:
+        if theme:
+            return f"{getattr(theme, style)(glyph)} "
+        if style == "error":
+            from yachalk import chalk
+
+            return f"{chalk.red_bright(glyph)} "
+    except Exception:  # glyph styling is cosmetic
+        pass
+    return glyph + " "
+
+
+_STYLE_HELPERS: Optional[tuple] = None
+
+
+def _style_helpers() -> tuple:
+    """``(_style_label_value, _accent_symbols)`` from clippy.utils, imported once."""
+    global _STYLE_HELPERS
+    if _STYLE_HELPERS is None:
+        try:
+            from clippy.utils import _accent_symbols, _style_label_value
+
+            _STYLE_HELPERS = (_style_label_value, _accent_symbols)
+        except Exception:  # optional styling helpers
+            _STYLE_HELPERS = (None, None)
+    return _STYLE_HELPERS
+
+
+def _info_body(msg: str, theme) -> str:
+    """Label/value styling plus symbol accents, falling back to plain theme text."""
+    style_label_value, accent_symbols = _style_helpers()
+    text = None
+    if style_label_value is not None:
+        try:
+            text = style_label_value(msg)
+        except Exception:  # styling is optional; fall through
+            pass
+    if text is None and theme:
+        try:
+            text = theme.text(msg)
+        except Exception:  # theme styling may fail
+            pass
+    if text is None:
+        text = msg
+    if accent_symbols is not None:
+        try:
+            return accent_symbols(text)
+        except Exception:  # accent is cosmetic
+            pass
+    return text
+
+
+def _error_body(msg: str, theme) -> str:
+    """Errors are red end to end.
+
+    Label/value colours would reset the red partway through the line, so they
+    are not applied here.
+    """
+    try:
+        if theme:
+            return theme.error(msg)
+        from yachalk import chalk
+
+        return chalk.red_bright(msg)
+    except Exception:  # chalk/theme may be unavailable
+        return msg
+
+
 # ---------------------------------------------------------------------------
 # BBS-themed Formatter
 # ---------------------------------------------------------------------------
@@ -83,79 +210,88 @@ class ClippyFormatter(logging.Formatter):
 
     Keeps the same visual style as the old ``utils.log()`` function:
     level 0 → indented info, 1 → bullet, 2 → chevron, 5/ERROR → red X.
+
+    With ``color=False`` (or ``NO_COLOR`` set) the message is emitted as-is
+    behind the plain prefix glyph, skipping the theme work entirely.
     """
 
+    def __init__(self, *args, color: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.color = color
+
     def format(self, record: logging.LogRecord) -> str:
-        _ensure_vt()
-        theme = _get_theme()
         msg = record.getMessage()
         sublevel = getattr(record, _CLIPPY_SUBLEVEL, None)
+        key = 5 if record.levelno >= logging.ERROR else sublevel
 
-        # If message already has ANSI, don't re-style
-        is_styled = "\x1b[" in msg
-
-        try:
-            from clippy.utils import _accent_symbols, _style_label_value
-        except Exception:  # optional styling helpers
-            _accent_symbols = _style_label_value = None  # type: ignore[assignment]
-
-        def _style(text: str) -> str:
-            if is_styled:
-                return text
-            if _style_label_value is not None:
-                try:
-                    return _style_label_value(text)
-                except Exception:  # styling is optional; fall through
-                    pass
-            if theme:
-                try:
-                    return theme.text(text)
-                except Exception:  # theme styling may fail
-                    pass
-            return text
+        # NO_COLOR is read per record: headless mode sets it after startup.
+        if not self.color or os.environ.get("NO_COLOR"):
+            return _PLAIN_PREFIX.get(key, "  ") + msg  # type: ignore[arg-type]
 
-        def _accent(text: str) -> str:
-            if _accent_symbols is not None:
-                try:
-                    return _accent_symbols(text)
-                except Exception:  # accent is cosmetic
-                    pass
-            return text
+        _ensure_vt()
+        theme = _get_theme()
 
-        body = _accent(_style(msg))
+        # Each line is styled exactly once, by the rule for its level.
+        if "\x1b[" in msg:
+            # Already styled by the caller; don't re-style
+            body = msg
+        elif key == 5:
+            body = _error_body(msg, theme)
+        else:
+            body = _info_body(msg, theme)
+        return _level_prefix(key, theme) + body
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that coalesces writes (``CLIPPY_LOG_BUFFER=1``).
+
+    Indented info lines (sub-level 0) are held back and written together with
+    the next step/detail/error line. The ``max_bytes`` and ``max_delay`` limits
+    are only checked as each line is logged; there is no timer, so a line
+    logged before a long quiet stretch waits for the next one. Anything still
+    buffered at exit goes out when ``logging.shutdown`` flushes the handlers.
+    """
 
-        if record.levelno >= logging.ERROR or sublevel == 5:
-            try:
-                if theme:
-                    if not is_styled:
-                        body = theme.error(body)
-                    x = theme.error("\u2716")
-                else:
-                    from yachalk import chalk
-
-                    if not is_styled:
-                        body = chalk.red_bright(body)
-                    x = chalk.red_bright("\u2716")
-            except Exception:  # chalk/theme may be unavailable
-                x = "\u2716"
-            return f"{x} {body}"
-
-        if sublevel == 2:
-            try:
-                chev = theme.symbol("\u203a") if theme else "\u203a"
-            except Exception:  # symbol styling is cosmetic
-                chev = "\u203a"
-            return f"{chev} {body}"
+    def __init__(self, stream=None, max_bytes: int = 8192, max_delay: float = 0.1):
+        super().__init__(stream)
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._last_write = time.monotonic()
 
-        if sublevel == 1:
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:  # same contract as StreamHandler.emit
+            self.handleError(record)
+            return
+        # handle() already holds self.lock around emit().
+        self._pending.append(line)
+        self._pending_size += len(line)
+        if (
+            getattr(record, _CLIPPY_SUBLEVEL, 0) >= 1
+            or record.levelno >= logging.WARNING
+            or self._pending_size >= self.max_bytes
+            or time.monotonic() - self._last_write >= self.max_delay
+        ):
             try:
-                bullet = theme.symbol("\u2022") if theme else "\u2022"
-            except Exception:  # symbol styling is cosmetic
-                bullet = "\u2022"
-            return f"{bullet} {body}"
-
-        # sublevel 0 / default
-        return f"  {body}"
+                self.flush()
+            except RecursionError:  # as StreamHandler.emit does
+                raise
+            except Exception:  # e.g. BrokenPipeError when piped into head
+                self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._pending:
+                try:
+                    self.stream.write("".join(self._pending))
+                finally:
+                    self._pending.clear()
+                    self._pending_size = 0
+            self._last_write = time.monotonic()
+            super().flush()
 
 
 # ---------------------------------------------------------------------------
@@ -165,8 +301,12 @@ class ClippyFormatter(logging.Formatter):
 _logger: Optional[logging.Logger] = None
 
 
-def setup_logging(level: int = logging.INFO) -> logging.Logger:
-    """Configure the ``clippy`` logger. Called once at startup."""
+def setup_logging(level: int = logging.INFO, force_color: Optional[bool] = None) -> logging.Logger:
+    """Configure the ``clippy`` logger. Called once at startup.
+
+    Output is coloured only when stdout is a terminal, unless ``force_color``
+    says otherwise.
+    """
     global _logger
     logger = logging.getLogger("clippy")
     if logger.handlers:
@@ -180,8 +320,17 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
             sys.stdout.reconfigure(encoding="utf-8", errors="replace")
         except Exception:  # reconfigure may not be supported on all streams
             pass
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(ClippyFormatter())
+    color = force_color
+    if color is None:
+        try:
+            color = sys.stdout.isatty()
+        except Exception:  # closed or exotic stream; treat as not a terminal
+            color = False
+    if os.environ.get("CLIPPY_LOG_BUFFER") == "1":
+        handler: logging.StreamHandler = _BufferedStreamHandler(sys.stdout)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(ClippyFormatter(color=color))
     logger.addHandler(handler)
     logger.propagate = False
     _logger = logger
@@ -206,7 +355,11 @@ def log(msg: object, level: int = 0) -> None:
 
     Maps the old numeric levels to stdlib levels and preserves the sub-level
     on the record so the ClippyFormatter can apply the correct prefix.
+    Sub-levels below ``CLIPPY_LOG_LEVEL`` return before any formatting;
+    errors (5) are never filtered.
     """
+    if level < _MIN_LEVEL and level != 5:
+        return
     logger = get_logger()
     stdlib_level = _OLD_LEVEL_MAP.get(level, logging.INFO)
     # Use logger.log with an extra dict to carry the sublevel
@@ -34,7 +34,7 @@ try:
 except ImportError:  # pragma: no cover
     THEME = None  # type: ignore
 
-    def enable_windows_vt():  # type: ignore
+    def enable_windows_vt(force: bool = False):  # type: ignore
         return
 
     def hi(value):  # type: ignore
@@ -1077,7 +1077,8 @@ def prepare_clips_concurrent(compilation, max_workers):
         return label
 
     try:
-        enable_windows_vt()
+        # Forced: the downloads and ffmpeg runs before this may have reset the console mode.
+        enable_windows_vt(force=True)
     except Exception:  # broad catch: VT setup is optional
         pass
     hdr = None
@@ -1342,9 +1343,10 @@ def write_concat_file(index: int, compilation: List[ClipRow]):
         asset_manifest,
         manifest_path,
     )
-    # Write file
-    with open(path, "w") as f:
-        f.write("\n".join(lines) + "\n")
+    # Write file. ffmpeg reads concat lists as UTF-8, so encode explicitly rather
+    # than with the locale default (cp1252 on Windows mangles non-ASCII paths).
+    with open(path, "wb", buffering=1 << 16) as f:
+        f.writelines(f"{line}\n".encode("utf-8") for line in lines)
 
 
 def stage_one(compilations: List[List[ClipRow]]):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 try:
     from yachalk import chalk  # type: ignore
@@ -13,9 +14,19 @@ except ImportError:  # pragma: no cover
     chalk = _Plain()  # type: ignore
 
 
-def enable_windows_vt() -> None:
-    if os.name != "nt":
+_VT_ENABLED = False
+
+
+def enable_windows_vt(force: bool = False) -> None:
+    """Turn on ANSI escape handling in the Windows console (once per process).
+
+    ``force`` re-applies it, for callers that run after child processes which
+    may have reset the console mode.
+    """
+    global _VT_ENABLED
+    if os.name != "nt" or (_VT_ENABLED and not force):
         return
+    _VT_ENABLED = True
     try:  # pragma: no cover
         import ctypes
 
@@ -79,26 +90,41 @@ def tx(text: str) -> str:
         return str(text)
 
 
+# Built chalk stylers keyed by style-name tuple. Callers pass literal names,
+# so this stays at a handful of entries.
+_STYLER_CACHE: dict[tuple[str, ...], Any] = {}
+
+
+def _styler(styles: tuple[str, ...]) -> Any:
+    s = _STYLER_CACHE.get(styles)
+    if s is None:
+        s = chalk
+        for st in styles:
+            try:
+                s = getattr(s, st)
+            except AttributeError:
+                pass
+        _STYLER_CACHE[styles] = s
+    return s
+
+
 def paint(text: str, *styles: str) -> str:
     """Best-effort wrapper around chalk styles by name."""
-    s = chalk
-    for st in styles:
-        try:
-            s = getattr(s, st)
-        except AttributeError:
-            pass
+    s = _styler(styles)
     try:
         return str(s(text))
     except Exception:  # chalk callable may fail on unusual input
         return text
 
 
+_STATUS_KINDS = {
+    "OK": ("OK", ("cyan", "bold")),
+    "WARN": ("WARN", ("magenta", "bold")),
+    "MISSING": ("MISSING", ("magenta", "bold")),
+    "INFO": ("INFO", ("blue", "bold")),
+}
+
+
 def status_tag(kind: str) -> str:
-    kinds = {
-        "OK": ("OK", ("cyan", "bold")),
-        "WARN": ("WARN", ("magenta", "bold")),
-        "MISSING": ("MISSING", ("magenta", "bold")),
-        "INFO": ("INFO", ("blue", "bold")),
-    }
-    text, styles = kinds.get(kind, (kind, ()))
+    text, styles = _STATUS_KINDS.get(kind, (kind, ()))
     return paint(f"[{text}]", *styles)
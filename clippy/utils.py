@@ -11,12 +11,37 @@ except ImportError:  # pragma: no cover
         return
 
 
+import functools
 import os
 import re
+from typing import Iterator
 
 # Note: Legacy '{@tag}' color markers were removed. Styling is applied centrally via THEME.
 
 
+# (config object, its to_flat_dict()); rebuilt when set_config() swaps the singleton.
+_FLAT_CACHE: tuple = (None, {})
+
+
+def _flat_config() -> dict:
+    global _FLAT_CACHE
+    cfg = _cfg_mod.get_config()
+    if _FLAT_CACHE[0] is not cfg:
+        _FLAT_CACHE = (cfg, cfg.to_flat_dict())
+    return _FLAT_CACHE[1]
+
+
+def refresh_config() -> None:
+    """Drop cached config lookups.
+
+    ``set_config()`` installs a new config object, which is picked up on its
+    own; this is only needed after mutating the current ``ClippyConfig`` in place.
+    """
+    global _FLAT_CACHE
+    _FLAT_CACHE = (None, {})
+    clear_transition_cache()
+
+
 def _cfg_get(name: str, default=None):
     """Best-effort getter for config values.
 
@@ -25,15 +50,22 @@ def _cfg_get(name: str, default=None):
     (binary paths, transitions_dir, etc.).
     """
     try:
-        flat = _cfg_mod.get_config().to_flat_dict()
+        flat = _flat_config()
         if name in flat:
             return flat[name]
     except Exception:  # typed config unavailable; fall through to globals
         pass
-    try:
-        return getattr(_cfg_mod, name, default)
-    except Exception:  # config can fail in many ways; broad catch intentional
-        return default
+    return getattr(_cfg_mod, name, default)
+
+
+# Standalone symbols that get the accent colour: a spaced '->' (drawn as an
+# arrow), existing arrow glyphs, and a spaced ':' or '*'. The spaces are
+# lookarounds, so back-to-back tokens (" -> : ") each still match.
+_ACCENT_RX = re.compile(r"(?<= )(?:->|:|\*)(?= )|\u2192")
+# Cache-key placeholder for "not built yet"; THEME itself may be None.
+_UNSET = object()
+# (THEME it was built from, token -> accented string)
+_ACCENT_MAP: tuple = (_UNSET, {})
 
 
 def _accent_symbols(s: str) -> str:
@@ -41,46 +73,68 @@ def _accent_symbols(s: str) -> str:
 
     Light heuristic: arrows, simple arrow token, middle colons, asterisks.
     """
-    try:
-        sym = THEME.symbol  # may raise if THEME missing
-    except (AttributeError, TypeError):
-        return s
-    try:
-        # Arrow token '->' becomes a single accented arrow
-        s = s.replace(" -> ", " " + str(sym("\u2192")) + " ")
-        # Existing arrow glyphs
-        s = s.replace("\u2192", str(sym("\u2192")))
-        # Colons between label and value: ' : '
-        s = s.replace(" : ", " " + str(sym(":")) + " ")
-        # Asterisks surrounded by spaces
-        s = s.replace(" * ", " " + str(sym("*")) + " ")
-        return s
-    except (AttributeError, TypeError):
-        return s
+    global _ACCENT_MAP
+    theme, accents = _ACCENT_MAP
+    if theme is not THEME:
+        try:
+            sym = THEME.symbol  # may raise if THEME missing
+            arrow = str(sym("\u2192"))
+            accents = {"->": arrow, "\u2192": arrow, ":": str(sym(":")), "*": str(sym("*"))}
+        except (AttributeError, TypeError):
+            return s
+        _ACCENT_MAP = (THEME, accents)
+    # One pass; the inserted escapes are never rescanned.
+    return _ACCENT_RX.sub(lambda mo: accents[mo.group(0)], s)
+
+
+# A drive prefix ("C:\", "d:/") or a separator with no whitespace around it
+# ("output/foo.mp4", "C:\Clippy\bin"). A bare "/" or "\" check would also
+# match things like a Discord "Guild Name / #channel" display string, which
+# isn't a path.
+_PATH_RX = re.compile(r"^.:[\\/]|\S[/\\]\S")
+# common file-ish values
+_PATH_EXTS = (".mp4", ".mp3", ".wav", ".png", ".jpg", ".jpeg", ".json", ".txt")
 
 
 def _looks_like_path(val: str) -> bool:
-    try:
-        if not val:
-            return False
-        v = val.strip()
-        # Windows drive letter or contains path separators
-        if len(v) >= 3 and v[1] == ":" and (v[2] == "\\" or v[2] == "/"):
-            return True
-        # A real path separator has no whitespace around it ("output/foo.mp4",
-        # "C:\Clippy\bin"). A bare "/" or "\" check also matches things like a
-        # Discord "Guild Name / #channel" display string, which isn't a path.
-        if re.search(r"\S[/\\]\S", v):
-            return True
-        # common file-ish values
-        if any(
-            v.lower().endswith(ext)
-            for ext in (".mp4", ".mp3", ".wav", ".png", ".jpg", ".jpeg", ".json", ".txt")
-        ):
-            return True
-        return False
-    except (AttributeError, TypeError):
+    if not val:
         return False
+    v = val.strip()
+    return bool(_PATH_RX.search(v)) or v.lower().endswith(_PATH_EXTS)
+
+
+# (THEME they came from, (label_fn, value_fn, path_fn, separator)); resolved on
+# first use so log lines don't repeat the getattr fallback chains.
+_LV_STYLES: tuple = (_UNSET, None)
+
+
+def _label_value_styles(theme) -> tuple:
+    global _LV_STYLES
+    if _LV_STYLES[0] is not theme:
+        text_fn = theme.text
+        label_fn = getattr(theme, "label", None) or getattr(theme, "section", None) or text_fn
+        value_fn = getattr(theme, "value", None) or text_fn
+        path_fn = getattr(theme, "path", None) or value_fn
+        # Compose with a themed separator if available
+        try:
+            sep = str(theme.symbol(":"))
+        except (AttributeError, TypeError):
+            sep = ":"
+        _LV_STYLES = (theme, (label_fn, value_fn, path_fn, sep))
+    return _LV_STYLES[1]
+
+
+def invalidate_theme_cache() -> None:
+    """Re-resolve the styles cached off THEME on next use.
+
+    Rebinding this module's THEME to another object is noticed automatically
+    (``clippy.log.refresh_theme()`` does that after ``clippy.theme.THEME`` is
+    replaced); this is for changes in place, such as reassigning a Theme
+    attribute or switching the chalk colour mode after the first log line.
+    """
+    global _LV_STYLES, _ACCENT_MAP
+    _LV_STYLES = (_UNSET, None)
+    _ACCENT_MAP = (_UNSET, {})
 
 
 def _style_label_value(rendered: str) -> str:
@@ -88,36 +142,16 @@ def _style_label_value(rendered: str) -> str:
 
     Falls back to THEME.text when heuristics don't match or THEME is unavailable.
     """
-    try:
-        if THEME is None:
-            return chalk.gray(rendered)
-    except (AttributeError, TypeError):
+    if THEME is None:
         return chalk.gray(rendered)
+    # One scan finds the split point; most log lines have none and stop here.
+    idx = rendered.find(": ")
     try:
-        if ": " not in rendered:
+        if idx < 0:
             # No obvious label/value split; default styling
             return THEME.text(rendered)
-        label, value = rendered.split(": ", 1)
-        # Choose styles
-        try:
-            label_fn = (
-                getattr(THEME, "label", None) or getattr(THEME, "section", None) or THEME.text
-            )
-        except (AttributeError, TypeError):
-            label_fn = THEME.text
-        try:
-            value_fn = getattr(THEME, "value", None) or THEME.text
-        except (AttributeError, TypeError):
-            value_fn = THEME.text
-        try:
-            path_fn = getattr(THEME, "path", None) or value_fn
-        except (AttributeError, TypeError):
-            path_fn = value_fn
-        # Compose with a themed separator if available
-        try:
-            sep = str(THEME.symbol(":"))
-        except (AttributeError, TypeError):
-            sep = ":"
+        label_fn, value_fn, path_fn, sep = _label_value_styles(THEME)
+        label, value = rendered[:idx], rendered[idx + 2 :]
         right = (path_fn if _looks_like_path(value) else value_fn)(value)
         return f"{label_fn(label)} {sep} {right}"
     except (AttributeError, TypeError):
@@ -131,53 +165,111 @@ def _style_label_value(rendered: str) -> str:
 # Delegate log() to the new centralized logging module
 from clippy.log import log  # noqa: E402,F401
 
+# Runs of anything outside the overlay/filename-safe subset.
+_NOT_ASCII_SAFE_RX = re.compile(r"[^A-Za-z0-9 ]+")
+# The same subset as a bytes delete-table, for the (usual) all-ASCII input.
+_ASCII_SAFE = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 "
+_ASCII_DROP = bytes(c for c in range(256) if c not in _ASCII_SAFE)
+
 
 # sanitize non-ASCII to a safe subset for overlays/filenames
 def fix_ascii(s: str) -> str:
-    return re.sub(r"[^A-Za-z0-9 ]+", "", str(s))
+    s = str(s)
+    if s.isascii():
+        # bytes.translate deletes in one C loop, with no regex matching.
+        return s.encode("ascii").translate(None, _ASCII_DROP).decode("ascii")
+    return _NOT_ASCII_SAFE_RX.sub("", s)
 
 
-# convert variables in the config to actual values
-def replace_vars(s, m):
-    _cache = _cfg_get("cache", "")
-    s = s.replace("{cache}", _cache)
-    s = s.replace("{message_id}", str(m[0]))
-    # Escape single quotes for ffmpeg drawtext text argument
-    author = (m[2] or "").replace("'", "\\'")
-    s = s.replace("{author}", author)
+def fix_ascii_many(items) -> list[str]:
+    """``fix_ascii`` over an iterable, e.g. every author name in a clip batch."""
+    return [fix_ascii(x) for x in items]
+
+
+def _cfg_token(name: str, default=""):
+    """Dispatch entry for a placeholder that is just a config value."""
+    return lambda m: _cfg_get(name, default)
+
+
+@functools.lru_cache(maxsize=4)
+def _ffmpeg_font_path(path: str) -> str:
     # Normalize font path to forward slashes for ffmpeg on Windows
+    return path.replace("\\", "/")
+
+
+def _font_token(m):
     _fontfile = _cfg_get("fontfile", None)
-    _font = (
-        _fontfile.replace("\\", "/").replace("\\", "/") if isinstance(_fontfile, str) else _fontfile
-    )
-    # When used inside filter_complex with single quotes around parameters, keep fontfile quoted
-    # The template expects fontfile='{fontfile}' so we only need to inject the raw path here
-    s = s.replace("{fontfile}", _font)
-    s = s.replace("{bitrate}", _cfg_get("bitrate", ""))
-    s = s.replace("{audio_bitrate}", _cfg_get("audio_bitrate", ""))
-    s = s.replace("{fps}", _cfg_get("fps", ""))
-    s = s.replace("{resolution}", _cfg_get("resolution", ""))
+    return _ffmpeg_font_path(_fontfile) if isinstance(_fontfile, str) else _fontfile
+
+
+# Placeholders that are just a config value: placeholder -> (config key, default).
+_CFG_TOKENS = {
+    "cache": ("cache", ""),
+    "bitrate": ("bitrate", ""),
+    "audio_bitrate": ("audio_bitrate", ""),
+    "fps": ("fps", ""),
+    "resolution": ("resolution", ""),
     # Encoder tuning parameters
-    s = s.replace("{cq}", _cfg_get("cq", ""))
-    s = s.replace("{gop}", _cfg_get("gop", ""))
-    s = s.replace("{rc_lookahead}", _cfg_get("rc_lookahead", ""))
-    s = s.replace("{spatial_aq}", _cfg_get("spatial_aq", ""))
-    s = s.replace("{aq_strength}", _cfg_get("aq_strength", ""))
-    s = s.replace("{temporal_aq}", _cfg_get("temporal_aq", ""))
-    s = s.replace("{nvenc_preset}", _cfg_get("nvenc_preset", ""))
+    "cq": ("cq", ""),
+    "gop": ("gop", ""),
+    "rc_lookahead": ("rc_lookahead", ""),
+    "spatial_aq": ("spatial_aq", ""),
+    "aq_strength": ("aq_strength", ""),
+    "temporal_aq": ("temporal_aq", ""),
+    "nvenc_preset": ("nvenc_preset", ""),
     # Container settings
-    s = s.replace("{ext}", _cfg_get("container_ext", "mp4"))
-    s = s.replace("{container_flags}", _cfg_get("container_flags", "-movflags +faststart"))
+    "ext": ("container_ext", "mp4"),
+    "container_flags": ("container_flags", "-movflags +faststart"),
     # yt-dlp format string (modelled on the typed config)
-    s = s.replace("{yt_format}", _cfg_get("yt_format", ""))
-    # ffmpeg path into youtubeDl options (unmodelled binary path)
-    try:
-        from clippy.config import ffmpeg as _ff
+    "yt_format": ("yt_format", ""),
+    # ffmpeg path into youtubeDl options (unmodelled binary path, read off
+    # the already-imported config module rather than re-imported per call)
+    "ffmpeg_path": ("ffmpeg", "ffmpeg"),
+}
+
+# placeholder name -> fn(m) producing its value; m is the (id, _, author) clip row.
+_TOKEN_FNS = {
+    "message_id": lambda m: str(m[0]),
+    # Escape single quotes for ffmpeg drawtext text argument
+    "author": lambda m: (m[2] or "").replace("'", "\\'"),
+    # When used inside filter_complex with single quotes around parameters, keep fontfile quoted
+    # The template expects fontfile='{fontfile}' so we only need to inject the raw path here
+    "fontfile": _font_token,
+    **{tok: _cfg_token(key, default) for tok, (key, default) in _CFG_TOKENS.items()},
+}
 
-        s = s.replace("{ffmpeg_path}", _ff)
-    except ImportError:
-        pass
-    return s
+# Only the known names match; any other {placeholder} is left as-is.
+_TOKEN_RE = re.compile(r"\{(" + "|".join(map(re.escape, _TOKEN_FNS)) + r")\}", re.ASCII)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str):
+    """Split *template* once into literal text and placeholder functions.
+
+    The same few templates (yt-dlp options, output names) are expanded for
+    every clip, so the regex scan happens once per template rather than per call.
+    """
+    pieces = _TOKEN_RE.split(template)  # literal, name, literal, name, ..., literal
+    if len(pieces) == 1:
+        return lambda m: template
+    head, literals = pieces[0], pieces[2::2]
+    fns = [_TOKEN_FNS[name] for name in pieces[1::2]]
+
+    def render(m) -> str:
+        out = [head]
+        for fn, literal in zip(fns, literals):
+            out.append(fn(m))
+            out.append(literal)
+        return "".join(out)
+
+    return render
+
+
+# convert variables in the config to actual values
+def replace_vars(s, m):
+    # Only the placeholders the template contains are resolved. Substituted
+    # values are never rescanned, so an author called "{bitrate}" stays literal.
+    return _compile_template(s)(m)
 
 
 def resolve_transitions_dir() -> str:
@@ -187,47 +279,77 @@ def resolve_transitions_dir() -> str:
             return os.path.abspath(env_dir)
     except OSError:
         pass
-    roots: list[str] = []
-    try:
-        import clippy.config as _cfg  # type: ignore
-
-        cfg_dir = getattr(_cfg, "transitions_dir", None)
-        if cfg_dir:
-            roots.append(os.path.abspath(str(cfg_dir)))
-    except (ImportError, OSError):
-        pass
-    # Source roots only: repo and CWD
-    # Repo and CWD fallbacks
-    try:
-        repo_dir = os.path.dirname(os.path.abspath(__file__))
-        roots += [os.path.join(repo_dir, "..", "transitions")]
-    except OSError:
-        pass
+    cfg_dir = getattr(_cfg_mod, "transitions_dir", None)
     try:
         cwd = os.getcwd()
-        roots += [os.path.join(cwd, "transitions")]
     except OSError:
-        pass
-    for r in roots:
-        try:
-            if r and os.path.isdir(r):
-                return os.path.abspath(r)
-        except OSError:
-            continue
+        cwd = ""
+    # Everything the lookup depends on is in the key, so a --transitions-dir
+    # override or a chdir resolves afresh instead of returning a stale root.
+    return _resolve_transitions_dir(str(cfg_dir) if cfg_dir else "", cwd)
+
+
+def _iter_transition_roots(env_dir: str, cfg_dir: str, cwd: str) -> Iterator[str]:
+    """Candidate transitions roots, most specific first.
+
+    TRANSITIONS_DIR, then the configured transitions_dir, then the source
+    checkout and CWD fallbacks.
+    """
+    if env_dir:
+        yield os.path.abspath(env_dir)
+    # Config-specified dir
+    if cfg_dir:
+        yield os.path.abspath(cfg_dir)
+    yield os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "transitions"))
+    if cwd:
+        yield os.path.join(cwd, "transitions")
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_transitions_dir(cfg_dir: str, cwd: str) -> str:
+    for r in _iter_transition_roots("", cfg_dir, cwd):
+        # isdir() reports False rather than raising; the roots are already absolute.
+        if os.path.isdir(r):
+            return r
+    return os.path.abspath("transitions")
+
+
+@functools.lru_cache(maxsize=8)
+def _build_transition_roots(env_dir: str, cfg_dir: str, cwd: str) -> tuple[str, ...]:
+    """Every root find_transition_file() searches, in order, without repeats.
+
+    Run from a checkout, the repo and CWD fallbacks are the same folder.
+    """
+    return tuple(dict.fromkeys(_iter_transition_roots(env_dir, cfg_dir, cwd)))
+
+
+def _transition_roots() -> tuple[str, ...]:
+    cfg_dir = getattr(_cfg_mod, "transitions_dir", None)
     try:
-        return os.path.abspath("transitions")
+        cwd = os.getcwd()
     except OSError:
-        return os.path.abspath("transitions")
+        cwd = ""
+    return _build_transition_roots(
+        os.getenv("TRANSITIONS_DIR") or "", str(cfg_dir) if cfg_dir else "", cwd
+    )
+
+
+# (name, roots, profile) -> absolute path found by find_transition_file(). Only
+# hits are kept: prep_work and the import scripts create assets mid-run.
+_FOUND_TRANSITIONS: dict[tuple, str] = {}
+_FOUND_TRANSITIONS_MAX = 256
+
+
+def clear_transition_cache() -> None:
+    """Forget resolved transition roots and asset paths (e.g. after moving files)."""
+    _resolve_transitions_dir.cache_clear()
+    _build_transition_roots.cache_clear()
+    _FOUND_TRANSITIONS.clear()
 
 
 def active_profile_name() -> str:
     """Name of the profile in effect, or "" when none is selected."""
-    try:
-        import clippy.config as _cfg  # type: ignore
-
-        return str(getattr(_cfg, "active_profile", "") or "").strip()
-    except (ImportError, OSError):
-        return ""
+    return str(getattr(_cfg_mod, "active_profile", "") or "").strip()
 
 
 def profile_asset_dir(root: str | None = None, profile: str | None = None) -> str | None:
@@ -271,46 +393,24 @@ def find_transition_file(name: str) -> str | None:
         # Absolute path shortcut
         if os.path.isabs(name) and os.path.exists(name):
             return os.path.abspath(name)
-        # Build candidate directories in the same order as resolve_transitions_dir,
-        # but keep all of them to allow fallback per file.
-        candidates: list[str] = []
-        env_dir = os.getenv("TRANSITIONS_DIR")
-        if env_dir:
-            candidates.append(os.path.abspath(env_dir))
-        # Config-specified dir
-        try:
-            import clippy.config as _cfg  # type: ignore
-
-            cfg_dir = getattr(_cfg, "transitions_dir", None)
-            if cfg_dir:
-                candidates.append(os.path.abspath(str(cfg_dir)))
-        except (ImportError, OSError):
-            pass
-
-        def _add(base: str):
-            candidates.append(os.path.join(base, "transitions"))
-
-        try:
-            repo_dir = os.path.dirname(os.path.abspath(__file__))
-            _add(repo_dir)
-        except OSError:
-            pass
-        try:
-            cwd = os.getcwd()
-            _add(cwd)
-        except OSError:
-            pass
+        # Same roots as resolve_transitions_dir (plus TRANSITIONS_DIR), but all
+        # of them are kept to allow fallback per file.
+        roots = _transition_roots()
+        profile = active_profile_name()
+        key = (name, roots, profile)
+        hit = _FOUND_TRANSITIONS.get(key)
+        if hit is not None:
+            return hit
         # Search <root>/<profile>/ before <root>/ so a profile's own intro wins
         # over a same-named shared one.
-        profile = active_profile_name()
-        for root in candidates:
+        for root in roots:
             for base in ([os.path.join(root, profile)] if profile else []) + [root]:
-                try:
-                    p = os.path.join(base, name)
-                    if os.path.exists(p):
-                        return os.path.abspath(p)
-                except OSError:
-                    continue
+                p = os.path.join(base, name)
+                if os.path.exists(p):
+                    if len(_FOUND_TRANSITIONS) >= _FOUND_TRANSITIONS_MAX:
+                        _FOUND_TRANSITIONS.clear()
+                    found = _FOUND_TRANSITIONS[key] = os.path.abspath(p)
+                    return found
         return None
     except (OSError, TypeError, ValueError):
         return None
@@ -420,6 +520,29 @@ def resolve_transition_pool(
 
 
 # clean up the cache folders and get ready to do some work
+# README.md dropped into each workspace folder by prep_work() if missing.
+_CACHE_README = (
+    "# cache\n\n"
+    "Temporary working directory.\n\n"
+    "- Each clip gets its own subfolder with intermediate files (clip.mp4, normalized.mp4, preview.png).\n"
+    "- Stage 2 outputs are written as complete_<date>_<idx>.<ext> before being moved to output/.\n"
+)
+
+_OUTPUT_README = (
+    "# output\n\n"
+    "Final compilations are moved here after encoding.\n\n"
+    "- Filenames include the broadcaster and date range.\n"
+    "- Use --overwrite-output to replace existing files, else _1, _2 suffixes are added.\n"
+)
+
+_TRANSITIONS_README = (
+    "# transitions\n\n"
+    "Put your intro/outro/transition clips here.\n\n"
+    "- static.mp4 is REQUIRED.\n"
+    "- You can provide intro_2.mp4, outro_2.mp4, transition_01.mp4, etc.\n"
+)
+
+
 def prep_work():
     # make our workspace
     def _display_path(p: str) -> str:
@@ -428,68 +551,40 @@ def prep_work():
         except OSError:
             return p
 
-    def _ensure_dir(path: str, label: str):
+    def _ensure_dir_and_readme(path: str, label: str, content: str):
         try:
-            if not os.path.exists(path):
-                log(f"creating new {label} directory at " + _display_path(path), 1)
-                os.makedirs(path, exist_ok=True)
+            os.makedirs(path)
+            log(f"created new {label} directory at " + _display_path(path), 1)
+        except FileExistsError:
+            pass
         except OSError as e:
             log("Failed to create " + str(label) + " dir: " + str(e), 5)
-
-    def _ensure_readme(path: str, content: str):
+            return
+        # Exclusive create: one open() both checks for the README and writes it.
         try:
-            readme_path = os.path.join(path, "README.md")
-            if not os.path.exists(readme_path):
-                os.makedirs(path, exist_ok=True)
-                with open(readme_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+            with open(os.path.join(path, "README.md"), "x", encoding="utf-8") as f:
+                f.write(content)
+        except FileExistsError:
+            pass
         except OSError as e:
             log("Failed to write README in " + str(path) + ": " + str(e), 5)
 
     # cache dir
     _cache = _cfg_get("cache", "./cache")
-    _ensure_dir(_cache, "cache")
-    _ensure_readme(
-        _cache,
-        (
-            "# cache\n\n"
-            "Temporary working directory.\n\n"
-            "- Each clip gets its own subfolder with intermediate files (clip.mp4, normalized.mp4, preview.png).\n"
-            "- Stage 2 outputs are written as complete_<date>_<idx>.<ext> before being moved to output/.\n"
-        ),
-    )
+    _ensure_dir_and_readme(_cache, "cache", _CACHE_README)
 
     # output dir
     _output = _cfg_get("output", "./output")
-    _ensure_dir(_output, "output")
-    _ensure_readme(
-        _output,
-        (
-            "# output\n\n"
-            "Final compilations are moved here after encoding.\n\n"
-            "- Filenames include the broadcaster and date range.\n"
-            "- Use --overwrite-output to replace existing files, else _1, _2 suffixes are added.\n"
-        ),
-    )
+    _ensure_dir_and_readme(_output, "output", _OUTPUT_README)
 
     # transitions dir
     transitions_dir = resolve_transitions_dir()
-    _ensure_readme(
-        transitions_dir,
-        (
-            "# transitions\n\n"
-            "Put your intro/outro/transition clips here.\n\n"
-            "- static.mp4 is REQUIRED.\n"
-            "- You can provide intro_2.mp4, outro_2.mp4, transition_01.mp4, etc.\n"
-        ),
-    )
-    try:
-        static_path = os.path.join(transitions_dir, "static.mp4")
-        if not os.path.exists(static_path):
-            log(
-                "WARN transitions/static.mp4 not found. Run 'clippy deps' to fetch the "
-                "default one, or place your own in the transitions folder.",
-                1,
-            )
-    except OSError as e:
-        log("Static file check error: " + str(e), 5)
+    _ensure_dir_and_readme(transitions_dir, "transitions", _TRANSITIONS_README)
+    if not os.path.exists(os.path.join(transitions_dir, "static.mp4")):
+        log(
+            "WARN transitions/static.mp4 not found. Run 'clippy deps' to fetch the "
+            "default one, or place your own in the transitions folder.",
+            1,
+        )
+    # The folders above may not have existed when the root was first resolved.
+    clear_transition_cache()
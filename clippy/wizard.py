@@ -1,134 +1,116 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
 import json
 import os
 from pathlib import Path
 from typing import Optional
 
-# Minimal color support via yachalk (fallback to plain)
-try:  # pragma: no cover
-    from yachalk import chalk  # type: ignore
-except Exception:  # pragma: no cover
-
-    class _Plain:
-        def __getattr__(self, name):
-            return lambda s: s
-
-    chalk = _Plain()  # type: ignore
+# Shares chalk (with its plain fallback) and the Windows VT switch with the
+# rest of the app instead of carrying a second copy of each.
+from clippy.theme import chalk
+from clippy.theme import enable_windows_vt as _enable_windows_vt
 
 
 # --- BBS-style theme (cool cyan/blue/gray) ----------------------------------
 class _Theme:
     def __init__(self):
+        # Bound chalk styles rather than lambdas: one call per styled string.
         # Core palette
-        self.bar = lambda s: chalk.gray(s)
-        self.title = lambda s: chalk.cyan_bright(s)
-        self.header = lambda s: chalk.cyan_bright(s)
-        self.section = lambda s: chalk.blue(s)
-        self.text = lambda s: chalk.gray(s)
-        self.path = lambda s: chalk.cyan(s)
-        self.success = lambda s: chalk.cyan(s)
-        self.warn = lambda s: chalk.magenta(s)
-        self.error = lambda s: chalk.magenta(s)
+        self.bar = chalk.gray
+        self.title = chalk.cyan_bright
+        self.header = chalk.cyan_bright
+        self.section = chalk.blue
+        self.text = chalk.gray
+        self.path = chalk.cyan
+        self.success = chalk.cyan
+        self.warn = chalk.magenta
+        self.error = chalk.magenta
         # Prompt parts
-        self.label = lambda s: chalk.cyan(s)
-        self.default = lambda s: chalk.blue_bright(s)
-        self.sep = lambda s: chalk.gray(s)
-        self.choice_default = lambda s: chalk.cyan_bright(s)
-        self.choice_other = lambda s: chalk.gray(s)
+        self.label = chalk.cyan
+        self.default = chalk.blue_bright
+        self.sep = chalk.gray
+        self.choice_default = chalk.cyan_bright
+        self.choice_other = chalk.gray
 
 
 THEME = _Theme()
 
+# Repository root (parent of the clippy package), resolved once.
+_ROOT = Path(__file__).resolve().parents[1]
 
-# Enable Windows VT so ANSI colors render in default console
-def _enable_windows_vt():
-    if os.name != "nt":
-        return
-    try:  # pragma: no cover
-        import ctypes
-
-        kernel32 = ctypes.windll.kernel32
-        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
-        mode = ctypes.c_uint32()
-        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
-            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
-            kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
-    except Exception:
-        pass
+# .env keys the wizard owns, written first and in this order.
+_ENV_KEY_ORDER = ("TWITCH_CLIENT_ID", "TWITCH_CLIENT_SECRET", "TRANSITIONS_DIR", "DISCORD_TOKEN")
 
 
-# Try to import project version and defaults
+# Try to import project version
 try:
     from clippy import __version__ as CLIPPY_VERSION  # type: ignore
 except Exception:
     CLIPPY_VERSION = "unknown"
 
-try:
-    # Import defaults for suggestions
-    from clippy.config import (
-        amountOfClips as DEFAULT_CLIPS,
-    )
-    from clippy.config import (
-        amountOfCompilations as DEFAULT_COMPS,
-    )
-    from clippy.config import (
-        audio_bitrate as DEFAULT_AUDIO_BR,
-    )
-    from clippy.config import (
-        cache as DEFAULT_CACHE,
-    )
-    from clippy.config import (
-        fps as DEFAULT_FPS,
-    )
-    from clippy.config import (
-        max_concurrency as DEFAULT_CONC,
-    )
-    from clippy.config import (
-        no_random_transitions as DEFAULT_NO_RANDOM,
-    )
-    from clippy.config import (
-        output as DEFAULT_OUTPUT,
-    )
-    from clippy.config import (
-        reactionThreshold as DEFAULT_MIN_VIEWS,
-    )
-    from clippy.config import (
-        resolution as DEFAULT_RES,
-    )
-    from clippy.config import (
-        silence_static as DEFAULT_SILENCE_STATIC,
-    )
-    from clippy.config import (
-        transition_probability as DEFAULT_TRANS_PROB,
-    )
+# Suggested defaults, filled by _load_defaults() on first use. Reading them
+# means importing clippy.config (which merges clippy.yaml), so only the setup
+# wizard pays for it -- not `clippy profile` or a plain import of this module.
+_DEFAULTS: Optional[dict] = None
+
 
+def _load_defaults() -> dict:
+    global _DEFAULTS
+    if _DEFAULTS is not None:
+        return _DEFAULTS
+    # Fallbacks if config import fails
+    defaults: dict = {
+        "clips": 12,
+        "comps": 2,
+        "min_views": 1,
+        "res": "1920x1080",
+        "fps": "60",
+        "audio_br": "192k",
+        "trans_prob": 0.35,
+        "no_random": False,
+        "cache": "./cache",
+        "output": "./output",
+        "conc": 4,
+        "silence_static": False,
+        "broadcaster": None,
+        "existing": {},
+    }
     try:
-        from clippy.config_loader import load_merged_config  # type: ignore
-
-        _existing_cfg = load_merged_config() or {}
-        # Prefer flattened key produced by loader; fallback to nested identity if present
-        DEFAULT_BROADCASTER = (
-            _existing_cfg.get("default_broadcaster")
-            or (_existing_cfg.get("identity") or {}).get("broadcaster")
-            or None
+        import clippy.config as _cfg
+
+        defaults.update(
+            clips=_cfg.amountOfClips,
+            comps=_cfg.amountOfCompilations,
+            min_views=_cfg.reactionThreshold,
+            res=_cfg.resolution,
+            fps=_cfg.fps,
+            audio_br=_cfg.audio_bitrate,
+            trans_prob=_cfg.transition_probability,
+            no_random=_cfg.no_random_transitions,
+            cache=_cfg.cache,
+            output=_cfg.output,
+            conc=_cfg.max_concurrency,
+            silence_static=_cfg.silence_static,
         )
+        try:
+            from clippy.config_loader import load_merged_config  # type: ignore
+
+            existing = load_merged_config() or {}
+            defaults["existing"] = existing
+            # Prefer flattened key produced by loader; fallback to nested identity if present
+            defaults["broadcaster"] = (
+                existing.get("default_broadcaster")
+                or (existing.get("identity") or {}).get("broadcaster")
+                or None
+            )
+        except Exception:
+            pass
     except Exception:
-        DEFAULT_BROADCASTER = None
-except Exception:
-    # Fallbacks if config import fails
-    DEFAULT_CLIPS = 12
-    DEFAULT_COMPS = 2
-    DEFAULT_MIN_VIEWS = 1
-    DEFAULT_RES = "1920x1080"
-    DEFAULT_FPS = "60"
-    DEFAULT_AUDIO_BR = "192k"
-    DEFAULT_TRANS_PROB = 0.35
-    DEFAULT_NO_RANDOM = False
-    DEFAULT_CACHE = "./cache"
-    DEFAULT_OUTPUT = "./output"
-    DEFAULT_CONC = 4
-    DEFAULT_SILENCE_STATIC = False
+        pass
+    _DEFAULTS = defaults
+    return defaults
 
 
 def _print_header():
@@ -160,86 +142,84 @@ def _mask_default(s: str, left: int = 6, right: int = 2) -> str:
 
 def _prompt_str(label: str, default: Optional[str] = None, secret: bool = False) -> str:
     d = f"{default}" if default not in (None, "") else ""
+    prompt = THEME.label(label)
+    if d:
+        disp = _mask_default(d) if secret else d
+        prompt = f"{prompt}{THEME.sep(' [')}{THEME.default(disp)}{THEME.sep(']')}"
+    prompt = f"{prompt}{THEME.sep(': ')}"
+    err = THEME.error("Please enter a value.")
     while True:
-        prompt = THEME.label(label)
-        if d:
-            disp = _mask_default(d) if secret else d
-            prompt += THEME.sep(" [") + THEME.default(disp) + THEME.sep("]")
-        prompt += THEME.sep(": ")
         val = input(prompt).strip()
         if not val and default is not None:
             return str(default)
         if val:
             return val
-        print(THEME.error("Please enter a value."))
+        print(err)
 
 
 def _prompt_int(
     label: str, default: int, min_v: Optional[int] = None, max_v: Optional[int] = None
 ) -> int:
+    prompt = f"{THEME.label(label)}{THEME.sep(' [')}{THEME.default(str(default))}{THEME.sep(']: ')}"
+    # Style the messages once; a retry loop just reprints them.
+    err_min = THEME.error(f"Minimum is {min_v}") if min_v is not None else ""
+    err_max = THEME.error(f"Maximum is {max_v}") if max_v is not None else ""
+    err_nan = THEME.error("Please enter a whole number.")
     while True:
-        prompt = (
-            THEME.label(label) + THEME.sep(" [") + THEME.default(str(default)) + THEME.sep("]: ")
-        )
         s = input(prompt).strip()
         if not s:
             return int(default)
         try:
             v = int(s)
             if min_v is not None and v < min_v:
-                print(THEME.error(f"Minimum is {min_v}"))
+                print(err_min)
                 continue
             if max_v is not None and v > max_v:
-                print(THEME.error(f"Maximum is {max_v}"))
+                print(err_max)
                 continue
             return v
         except Exception:
-            print(THEME.error("Please enter a whole number."))
+            print(err_nan)
 
 
 def _prompt_float(
     label: str, default: float, min_v: Optional[float] = None, max_v: Optional[float] = None
 ) -> float:
+    prompt = f"{THEME.label(label)}{THEME.sep(' [')}{THEME.default(str(default))}{THEME.sep(']: ')}"
+    # Style the messages once; a retry loop just reprints them.
+    err_min = THEME.error(f"Minimum is {min_v}") if min_v is not None else ""
+    err_max = THEME.error(f"Maximum is {max_v}") if max_v is not None else ""
+    err_nan = THEME.error("Please enter a number.")
     while True:
-        prompt = (
-            THEME.label(label) + THEME.sep(" [") + THEME.default(str(default)) + THEME.sep("]: ")
-        )
         s = input(prompt).strip()
         if not s:
             return float(default)
         try:
             v = float(s)
             if min_v is not None and v < min_v:
-                print(THEME.error(f"Minimum is {min_v}"))
+                print(err_min)
                 continue
             if max_v is not None and v > max_v:
-                print(THEME.error(f"Maximum is {max_v}"))
+                print(err_max)
                 continue
             return v
         except Exception:
-            print(THEME.error("Please enter a number."))
+            print(err_nan)
 
 
 def _prompt_yes_no(label: str, default_yes: bool = True) -> bool:
     # Render BBS-style choice with highlighted default
     if default_yes:
-        d_colored = (
-            THEME.sep("[")
-            + THEME.choice_default("Y")
-            + THEME.sep("/")
-            + THEME.choice_other("n")
-            + THEME.sep("]")
-        )
+        yes, no = THEME.choice_default("Y"), THEME.choice_other("n")
     else:
-        d_colored = (
-            THEME.sep("[")
-            + THEME.choice_other("y")
-            + THEME.sep("/")
-            + THEME.choice_default("N")
-            + THEME.sep("]")
-        )
+        yes, no = THEME.choice_other("y"), THEME.choice_default("N")
+    bracket_l, slash, bracket_r = THEME.sep("["), THEME.sep("/"), THEME.sep("]")
+    prompt = (
+        f"{THEME.label(label)}{THEME.sep(' ')}"
+        f"{bracket_l}{yes}{slash}{no}{bracket_r}{THEME.sep(': ')}"
+    )
+    err = THEME.error("Please answer y or n.")
     while True:
-        prompt = THEME.label(label) + THEME.sep(" ") + d_colored + THEME.sep(": ")
         s = input(prompt).strip().lower()
         if not s:
             return default_yes
@@ -247,7 +227,7 @@ def _prompt_yes_no(label: str, default_yes: bool = True) -> bool:
             return True
         if s in ("n", "no"):
             return False
-        print(THEME.error("Please answer y or n."))
+        print(err)
 
 
 def _prompt_list_csv(label: str, default: Optional[list[str]] = None) -> tuple[bool, list[str]]:
@@ -258,8 +238,9 @@ def _prompt_list_csv(label: str, default: Optional[list[str]] = None) -> tuple[b
     """
     default_list = list(default or [])
     shown = ", ".join(default_list) if default_list else "(none)"
+    prompt = f"{THEME.label(label)}{THEME.sep(' [')}{THEME.default(shown)}{THEME.sep(']: ')}"
+    err = THEME.error("Please enter one or more names separated by commas, or '-' to clear.")
     while True:
-        prompt = THEME.label(label) + THEME.sep(" [") + THEME.default(shown) + THEME.sep("]: ")
         s = input(prompt).strip()
         if not s:
             return False, default_list
@@ -271,7 +252,7 @@ def _prompt_list_csv(label: str, default: Optional[list[str]] = None) -> tuple[b
         items = [p for p in parts if p]
         if items:
             return True, items
-        print(THEME.error("Please enter one or more names separated by commas, or '-' to clear."))
+        print(err)
 
 
 def _quality_menu() -> tuple[str, str]:
@@ -301,17 +282,19 @@ def _transitions_explain():
     # Removed silencing transitions/intro/outro; only silence_static is supported
 
 
-def _find_static_candidates() -> list[Path]:
-    root = Path(__file__).resolve().parents[1]
-    candidates = [
-        root / "transitions" / "static.mp4",
-        root / "cache" / "_trans" / "static.mp4",
-    ]
-    return [p for p in candidates if p.is_file()]
+@functools.lru_cache(maxsize=1)
+def _find_static_candidates() -> tuple[Path, ...]:
+    candidates = (
+        _ROOT / "transitions" / "static.mp4",
+        _ROOT / "cache" / "_trans" / "static.mp4",
+    )
+    return tuple(p for p in candidates if p.is_file())
 
 
 def main():
     _print_header()
+    defaults = _load_defaults()
+    _existing_cfg = defaults["existing"]
 
     # Step 0: Choose source of clips
     print(THEME.header("Step 0: Choose your clip source"))
@@ -357,16 +340,19 @@ def main():
     )
     env_path = Path(".env")
     existing = {}
-    if env_path.is_file():
-        try:
-            for line in env_path.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                existing[k.strip()] = v.strip()
-        except Exception:
-            pass
+    try:
+        # One stat covers "missing" (raises) and "empty" (size 0, nothing to parse).
+        if env_path.stat().st_size:
+            strip = str.strip
+            text = env_path.read_text(encoding="utf-8", errors="replace")
+            pairs = (
+                ln.split("=", 1)
+                for ln in map(strip, text.splitlines())
+                if ln and ln[0] != "#" and "=" in ln
+            )
+            existing = {strip(k): strip(v) for k, v in pairs}
+    except Exception:
+        pass
     cid_default = existing.get("TWITCH_CLIENT_ID") or os.getenv("TWITCH_CLIENT_ID", "")
     sec_default = existing.get("TWITCH_CLIENT_SECRET") or os.getenv("TWITCH_CLIENT_SECRET", "")
     client_id = _prompt_str("Twitch Client ID", cid_default or None, secret=True)
@@ -477,35 +463,40 @@ def main():
 
     # Step 3: Defaults for selection and identity (always capture a broadcaster name)
     print("\n" + THEME.header("Step 3: Clip selection & identity"))
-    _shown = str(DEFAULT_BROADCASTER) if (DEFAULT_BROADCASTER not in (None, "")) else "(none)"
+    prior_broadcaster = defaults["broadcaster"]
+    _shown = str(prior_broadcaster) if (prior_broadcaster not in (None, "")) else "(none)"
     print(THEME.text("  Current default broadcaster:") + " " + THEME.path(_shown))
     print(THEME.text("  Even in Discord mode, we use a broadcaster name for naming and defaults."))
     print(
         THEME.text("  Set a default to skip typing --broadcaster each run (leave blank to keep).")
     )
-    min_views = _prompt_int("Minimum views to include a clip", DEFAULT_MIN_VIEWS, 0)
-    clips_per_comp = _prompt_int("Clips per compilation", DEFAULT_CLIPS, 1)
-    num_compilations = _prompt_int("Number of compilations per run", DEFAULT_COMPS, 1)
+    min_views = _prompt_int("Minimum views to include a clip", defaults["min_views"], 0)
+    clips_per_comp = _prompt_int("Clips per compilation", defaults["clips"], 1)
+    num_compilations = _prompt_int("Number of compilations per run", defaults["comps"], 1)
     default_broadcaster = _prompt_str(
-        "Default broadcaster (Twitch username)", DEFAULT_BROADCASTER or ""
+        "Default broadcaster (Twitch username)", prior_broadcaster or ""
     )
 
     # Step 4: Quality and format
     print("\n" + THEME.header("Step 4: Output quality & format"))
     preset_name, bitrate = _quality_menu()
-    resolution = _prompt_str("Resolution (e.g., 1920x1080)", DEFAULT_RES)
-    fps = _prompt_str("Framerate (e.g., 60)", DEFAULT_FPS)
-    audio_br = _prompt_str("Audio bitrate (e.g., 192k)", DEFAULT_AUDIO_BR)
+    resolution = _prompt_str("Resolution (e.g., 1920x1080)", defaults["res"])
+    fps = _prompt_str("Framerate (e.g., 60)", defaults["fps"])
+    audio_br = _prompt_str("Audio bitrate (e.g., 192k)", defaults["audio_br"])
 
     # Step 5: Transitions & intros/outros
     _transitions_explain()
-    use_random = not _prompt_yes_no("Disable random transitions?", default_yes=DEFAULT_NO_RANDOM)
-    trans_prob = DEFAULT_TRANS_PROB
+    use_random = not _prompt_yes_no(
+        "Disable random transitions?", default_yes=defaults["no_random"]
+    )
+    trans_prob = defaults["trans_prob"]
     if use_random:
         trans_prob = _prompt_float(
-            "Probability to insert a transition (0.0 - 1.0)", DEFAULT_TRANS_PROB, 0.0, 1.0
+            "Probability to insert a transition (0.0 - 1.0)", defaults["trans_prob"], 0.0, 1.0
         )
-    silence_static = _prompt_yes_no("Silence static.mp4 audio?", default_yes=DEFAULT_SILENCE_STATIC)
+    silence_static = _prompt_yes_no(
+        "Silence static.mp4 audio?", default_yes=defaults["silence_static"]
+    )
 
     # Intro/Outro configuration
     try:
@@ -533,9 +524,9 @@ def main():
 
     # Step 6: Paths & concurrency
     print("\n" + THEME.header("Step 6: Paths & concurrency"))
-    cache_dir = _prompt_str("Cache directory", DEFAULT_CACHE)
-    output_dir = _prompt_str("Output directory", DEFAULT_OUTPUT)
-    conc = _prompt_int("Max concurrent workers (downloads/normalize)", DEFAULT_CONC, 1)
+    cache_dir = _prompt_str("Cache directory", defaults["cache"])
+    output_dir = _prompt_str("Output directory", defaults["output"])
+    conc = _prompt_int("Max concurrent workers (downloads/normalize)", defaults["conc"], 1)
 
     # Step 7: Transitions location
     print("\n" + THEME.header("Step 7: Transitions directory"))
@@ -558,17 +549,12 @@ def main():
     if discord_token:
         env_out["DISCORD_TOKEN"] = discord_token
     # Emit in a stable order (Twitch first), then others
-    ordered_keys = ["TWITCH_CLIENT_ID", "TWITCH_CLIENT_SECRET", "TRANSITIONS_DIR", "DISCORD_TOKEN"]
-    other_items = [(k, v) for k, v in env_out.items() if k not in ordered_keys]
-    lines = []
-    for k in ordered_keys:
-        if k in env_out and env_out[k] not in (None, ""):
-            lines.append(f"{k}={env_out[k]}")
-    for k, v in other_items:
-        if v not in (None, ""):
-            lines.append(f"{k}={v}")
+    keys = [k for k in _ENV_KEY_ORDER if k in env_out]
+    keys += [k for k in env_out if k not in _ENV_KEY_ORDER]
+    lines = [f"{k}={env_out[k]}" for k in keys if env_out[k] not in (None, "")]
     try:
-        env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        with env_path.open("w", encoding="utf-8") as fh:
+            fh.writelines(f"{line}\n" for line in lines)
         print("\n" + THEME.success(f"Wrote {env_path.resolve()}"))
     except Exception as e:
         print("\n" + THEME.warn(f"WARN: Failed to write .env: {e}"))
@@ -655,19 +641,29 @@ def main():
         cfg["assets"]["outro"] = outro_list
     elif isinstance(prior_assets, dict) and prior_assets.get("outro") is not None:
         cfg["assets"]["outro"] = prior_assets.get("outro")
-    try:
-        yaml_text = yaml.safe_dump(cfg, sort_keys=False)
-        yaml_path = Path("clippy.yaml")
-        yaml_path.write_text(yaml_text, encoding="utf-8")
-        print(THEME.success(f"Wrote {yaml_path.resolve()}"))
-    except Exception as e:
+    # Decide up front rather than letting a missing PyYAML fail mid-write.
+    if importlib.util.find_spec("yaml") is not None:
+        try:
+            import yaml  # type: ignore
+
+            yaml_path = Path("clippy.yaml")
+            # Stream straight into the buffered file; PyYAML emits many tiny writes.
+            with yaml_path.open("w", encoding="utf-8") as fh:
+                yaml.safe_dump(
+                    cfg, fh, sort_keys=False, default_flow_style=False, allow_unicode=True
+                )
+            print(THEME.success(f"Wrote {yaml_path.resolve()}"))
+        except Exception as e:
+            print(THEME.warn(f"WARN: Failed to write config file: {e}"))
+    else:
         # Fallback to JSON if PyYAML missing
         try:
             json_path = Path("clippy.yaml.json")
-            json_path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+            with json_path.open("w", encoding="utf-8") as fh:
+                json.dump(cfg, fh, indent=2)
             print(THEME.warn(f"PyYAML not available; wrote JSON fallback: {json_path.resolve()}"))
-        except Exception as e2:
-            print(THEME.warn(f"WARN: Failed to write config file: {e} / {e2}"))
+        except Exception as e:
+            print(THEME.warn(f"WARN: Failed to write config file: {e}"))
 
     # No longer generating run_clippy.ps1; rely on clippy.yaml defaults and CLI overrides
 
@@ -708,13 +704,6 @@ def main():
     print(THEME.text("  2) Check output/ for your compiled videos and manifest.json"))
 
 
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print("\nSetup cancelled by user.")
-
-
 # ---------------------------------------------------------------------------
 # Profile wizard — per-streamer defaults and branding
 # ---------------------------------------------------------------------------
@@ -737,7 +726,8 @@ def _write_yaml_config(path: Path, data: dict) -> bool:
     try:
         import yaml
 
-        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+        text = yaml.safe_dump(data, sort_keys=False, default_flow_style=False, allow_unicode=True)
+        path.write_text(text, encoding="utf-8")
         return True
     except Exception as exc:
         print(THEME.error(f"Could not write {path}: {exc}"))
@@ -916,3 +906,10 @@ def _offer_asset_dir(name: str) -> None:
         print(THEME.text("  Anything missing falls back to the shared transitions folder."))
     except OSError as exc:
         print(THEME.error(f"Could not create {asset_dir}: {exc}"))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nSetup cancelled by user.")
@@ -25,10 +25,11 @@ from __future__ import annotations
 import argparse
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 # Ensure repository root on path for config/utils
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -63,9 +64,10 @@ except Exception:
 from clippy.utils import log, resolve_transitions_dir
 
 
-def _run(cmd: str) -> Tuple[int, str]:
+def _run(cmd: List[str]) -> Tuple[int, str]:
+    # argv list, no shell: paths need no quoting and no cmd.exe is spawned on Windows.
     try:
-        proc = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         out = (proc.stdout or b"").decode(errors="ignore") + (proc.stderr or b"").decode(
             errors="ignore"
         )
@@ -75,7 +77,7 @@ def _run(cmd: str) -> Tuple[int, str]:
 
 
 def _has_nvenc(ff: str) -> bool:
-    code, out = _run(f'"{ff}" -hide_banner -encoders')
+    code, out = _run([ff, "-hide_banner", "-encoders"])
     return code == 0 and ("h264_nvenc" in out)
 
 
@@ -150,37 +152,49 @@ def pick_output_name(tdir: str, kind: str, override: Optional[str]) -> str:
     return next_transition_name(tdir)
 
 
-def build_ffmpeg_cmd(src: str, dst: str, use_nvenc: bool, normalize_audio: bool) -> str:
-    vcodec = "h264_nvenc" if use_nvenc else "libx264"
-    vrc = f"-rc vbr -cq {cq} -b:v 0 -maxrate {bitrate} -bufsize {bitrate}"
-    # libx264 doesn't support -rc vbr/-cq; map approximately to CRF
-    if not use_nvenc:
+def build_ffmpeg_cmd(src: str, dst: str, use_nvenc: bool, normalize_audio: bool) -> List[str]:
+    if use_nvenc:
+        video = ["-c:v", "h264_nvenc", "-rc", "vbr", "-cq", str(cq), "-b:v", "0"]
+        video += ["-maxrate", str(bitrate), "-bufsize", str(bitrate)]
+        video += ["-profile:v", "high", "-level", "4.2", "-g", str(gop), "-bf", "3"]
+        video += ["-rc-lookahead", str(rc_lookahead), "-spatial_aq", str(spatial_aq)]
+        video += ["-aq-strength", str(aq_strength), "-temporal-aq", str(temporal_aq)]
+        preset = str(nvenc_preset)
+    else:
+        # libx264 doesn't support -rc vbr/-cq or the NVENC AQ flags; map cq approximately to CRF
         try:
             cq_int = int(str(cq))
         except Exception:
             cq_int = 19
         # Map NVENC cq ~ 19 to libx264 crf ~ 20
-        vrc = f"-crf {max(0, min(51, cq_int+1))} -preset slow"
-    _af = " -af loudnorm=I=-16:TP=-1.5:LRA=11" if normalize_audio else ""
-    cmd = (
-        f'"{ffmpeg}" -y -i "{src}" '
-        f"-r {fps} -s {resolution} -sws_flags lanczos "
-        f"-c:v {vcodec} {vrc} "
-        f"-profile:v high -level 4.2 -g {gop} -bf 3 -rc-lookahead {rc_lookahead} "
-        f"-spatial_aq {spatial_aq} -aq-strength {aq_strength} -temporal-aq {temporal_aq} "
-        f"-pix_fmt yuv420p{_af} -c:a aac -b:a {audio_bitrate} "
-        f"{container_flags} -preset {nvenc_preset} "
-        f'"{dst}"'
-    )
-    if not use_nvenc:
-        # remove NVENC-only flags when libx264 is used
-        cmd = cmd.replace("-rc-lookahead", "#-rc-lookahead")
-        cmd = cmd.replace("-spatial_aq", "#-spatial_aq")
-        cmd = cmd.replace("-temporal-aq", "#-temporal-aq")
-        cmd = cmd.replace("-aq-strength", "#-aq-strength")
-        cmd = re.sub(r"\s-rc\s+vbr\s+-cq\s+\S+\s+-b:v 0\s+-maxrate\s+\S+\s+-bufsize\s+\S+", "", cmd)
-        cmd = cmd.replace(f"-preset {nvenc_preset}", "-preset slow")
-    return cmd
+        video = ["-c:v", "libx264", "-crf", str(max(0, min(51, cq_int + 1)))]
+        video += ["-profile:v", "high", "-level", "4.2", "-g", str(gop), "-bf", "3"]
+        preset = "slow"
+    af = ["-af", "loudnorm=I=-16:TP=-1.5:LRA=11"] if normalize_audio else []
+    return [
+        ffmpeg,
+        "-y",
+        "-i",
+        src,
+        "-r",
+        str(fps),
+        "-s",
+        str(resolution),
+        "-sws_flags",
+        "lanczos",
+        *video,
+        "-pix_fmt",
+        "yuv420p",
+        *af,
+        "-c:a",
+        "aac",
+        "-b:a",
+        str(audio_bitrate),
+        *shlex.split(str(container_flags or "")),
+        "-preset",
+        preset,
+        dst,
+    ]
 
 
 def import_one(
@@ -202,7 +216,7 @@ def import_one(
     tmp_path = out_path + ".tmp.mp4"
     use_nv = _has_nvenc(ffmpeg)
     cmd = build_ffmpeg_cmd(src, tmp_path, use_nv, normalize_audio)
-    log("Encoding: " + cmd, 1)
+    log("Encoding: " + subprocess.list2cmdline(cmd), 1)
     code, out = _run(cmd)
     if code != 0:
         # If NVENC failed, retry with libx264 automatically once
@@ -3,7 +3,7 @@ Local smoke test for the processing pipeline without Twitch.
 
 What it does:
 - Copies transitions/static.mp4 into cache/smoketest/clip.mp4
-- Optionally generates a tiny avatar.png for overlay stage
+- Optionally writes a tiny avatar.png for overlay stage
 - Runs process_clip (normalize [+ overlay])
 - Writes a concat list with the single clip and static
 - Runs stage_two to produce a final output file
@@ -17,6 +17,7 @@ This exercises Windows path quoting and shell invocation in ffmpeg calls.
 from __future__ import annotations
 
 import argparse
+import base64
 import os
 import shutil
 import sys
@@ -28,16 +29,36 @@ _ROOT = _HERE.parents[1]
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
+# 128x128 white disc on transparent, for the overlay stage.
+_AVATAR_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAAAB0UlEQVR42u3di20EQQgE0YH8c15nYMmf1cH0qwyA"
+    "moa1JfscAAAAAAAAAAAAAABwG5VS6PM8z4+bU1UECBl2qhRl4NlClMFni1CGni1DGXy2CGXw2SK04WfXURqWnQZt"
+    "+Nn1teaEf75qSPZKaMPPrr8NP1uCNvxsCdrwsyVow8+WoA0/W4LW7mza689OgTb8bAna8LMlcAO4Abz+5BRow8+W"
+    "wAqwArz+5BSQABLA609OAQkgAUAA8R+7BiSABPD6k1NAAkgAEAAEsP8z7wAJIAFAABAABHAABh6CEkACgAAgAAgA"
+    "AoAAIAAIAAKAACAACPAtCf9abTJ/7b8EkAAgAAgAAjgEww5ACQACEAAEcAdk7n8JgP8VQArsev0SAAQgwOB4wvv9"
+    "lQASYL6leK+vEkAC7LHV61/2FUCC+X20AqyAvfZ6/UsSgARz+9Y3FWP4bgBMFkAKzOtT31yc4Q9dASSY05dOKtbw"
+    "hx2BJPh8Hzq5+PThn3POqOYn/d3hKeK3pmTX2ZqTXd/oZt+0EqaK3ZqWXceaBm9Mgw0Cr3thG0TYlFyrI3aSDFvX"
+    "1RU79pMibL9TrvzkelOI2z5TY34M+xsp/K4CAAAAAAAAAAAAALCUL+a05LJqk5wJAAAAAElFTkSuQmCC"
+)
+
+# 200x60 translucent red block, for the watermark filter.
+_LOGO_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAMgAAAA8CAYAAAAjW/WRAAAAkklEQVR42u3TMREAMAgEwSf+5eAPDKSh35VwM1eT"
+    "dICvJwEYBAwCBgGDgEHAIGAQMAgYBDAIGAQMAgYBg4BBwCBgEDAIGAQwCBgEDAIGAYOAQcAgYBAwCGAQMAgYBAwC"
+    "BgGDgEHAIGAQMAhgEDAIGAQMAgYBg4BBwCBgEMAgYBAwCBgEDAIGAYOAQcAgYBDAIHCxzbYCK8rsp9gAAAAASUVO"
+    "RK5CYII="
+)
+
 
 def main():
     ap = argparse.ArgumentParser(description="Local pipeline smoke test (no Twitch)")
     ap.add_argument(
-        "--overlay", action="store_true", help="Enable overlay stage (generates avatar.png)"
+        "--overlay", action="store_true", help="Enable overlay stage (writes avatar.png)"
     )
     ap.add_argument(
         "--watermark",
         action="store_true",
-        help="Enable a logo watermark too (generates a small logo.png)",
+        help="Enable a logo watermark too (writes a small logo.png)",
     )
     ap.add_argument(
         "-y",
@@ -78,32 +99,15 @@ def main():
     clip_in = os.path.join(clip_dir, "clip.mp4")
     shutil.copy2(static_src, clip_in)
 
-    # Optionally create a simple avatar.png for overlay stage
+    # Optionally write a simple avatar.png for overlay stage
     if args.overlay:
-        try:
-            from PIL import Image, ImageDraw
-
-            avatar = Image.new("RGBA", (128, 128), (0, 0, 0, 0))
-            d = ImageDraw.Draw(avatar)
-            d.ellipse((16, 16, 112, 112), fill=(255, 255, 255, 255))
-            avatar.save(os.path.join(clip_dir, "avatar.png"), "PNG")
-        except Exception:
-            # If Pillow is not available in this environment, skip overlay
-            args.overlay = False
-
-    # Optionally create a small logo.png to exercise the watermark filter.
+        Path(clip_dir, "avatar.png").write_bytes(base64.b64decode(_AVATAR_PNG_B64))
+
+    # Optionally write a small logo.png to exercise the watermark filter.
     watermark_path = ""
     if args.watermark:
-        try:
-            from PIL import Image, ImageDraw
-
-            logo = Image.new("RGBA", (200, 60), (0, 0, 0, 0))
-            d = ImageDraw.Draw(logo)
-            d.rectangle((0, 0, 199, 59), fill=(255, 0, 0, 180))
-            watermark_path = os.path.abspath(os.path.join(clip_dir, "logo.png"))
-            logo.save(watermark_path, "PNG")
-        except Exception:
-            args.watermark = False
+        watermark_path = os.path.abspath(os.path.join(clip_dir, "logo.png"))
+        Path(watermark_path).write_bytes(base64.b64decode(_LOGO_PNG_B64))
 
     # Configure the overlay/watermark toggles on the typed config, which is
     # what the pipeline reads. rebuild stays off: the clip dir is wiped above,
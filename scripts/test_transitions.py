@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import subprocess
 import sys
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _REPO_ROOT = os.path.dirname(_SCRIPT_DIR)
@@ -30,31 +32,48 @@ from clippy.config import (
 from clippy.utils import log, resolve_transitions_dir
 
 
-def run(cmd: List[str]) -> Tuple[int, bytes, bytes]:
+def run(cmd: List[str], capture_stdout: bool = False) -> Tuple[int, bytes, bytes]:
+    """Run ``cmd``; stdout is discarded (returned as b"") unless ``capture_stdout``."""
+    stdout = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
     try:
-        p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return p.returncode, p.stdout, p.stderr
+        p = subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE)
+        return p.returncode, p.stdout or b"", p.stderr
     except FileNotFoundError as e:
         log("Executable not found: " + str(e), 5)
         return 127, b"", str(e).encode()
 
 
+# path -> has audio; the probe pass fills it and normalize_asset reuses it.
+_HAS_AUDIO: Dict[str, bool] = {}
+
+
 def probe_has_audio(path: str) -> bool:
+    """True if ``path`` has an audio stream; probed once per path and cached."""
+    cached = _HAS_AUDIO.get(path)
+    if cached is not None:
+        return cached
+    rc, out, _err = run(
+        [ffprobe, "-v", "error", "-show_entries", "stream=codec_type", "-of", "json", path],
+        capture_stdout=True,
+    )
+    has_audio = False
+    if rc == 0:
+        try:
+            streams = json.loads(out.decode("utf-8", errors="ignore")).get("streams") or []
+        except ValueError:
+            streams = []
+        has_audio = any(st.get("codec_type") == "audio" for st in streams)
+    _HAS_AUDIO[path] = has_audio
+    return has_audio
+
+
+def muxcheck(path: str) -> Tuple[bool, str]:
+    """Demux every packet without decoding: catches truncated/corrupt containers quickly."""
     rc, _out, _err = run(
-        [
-            ffprobe,
-            "-v",
-            "error",
-            "-select_streams",
-            "a:0",
-            "-show_entries",
-            "stream=codec_type",
-            "-of",
-            "csv=p=0",
-            path,
-        ]
+        [ffmpeg, "-v", "error", "-xerror", "-i", path, "-c", "copy", "-f", "null", "-"]
     )
-    return rc == 0 and (_out.strip() != b"")
+    ok = rc == 0
+    return ok, _err.decode("utf-8", errors="ignore")
 
 
 def decode_check(path: str) -> Tuple[bool, str]:
@@ -63,9 +82,33 @@ def decode_check(path: str) -> Tuple[bool, str]:
     return ok, _err.decode("utf-8", errors="ignore")
 
 
+# Legacy NVENC preset names and the modern preset/multipass pair ffmpeg maps them
+# to internally. Spelling it out keeps the quality the name implied while
+# putting the real knobs on the command line.
+_NVENC_LEGACY_PRESETS = {
+    "slow": ("p7", "fullres"),
+    "hq": ("p4", "disabled"),
+    "medium": ("p4", "disabled"),
+    "default": ("p4", "disabled"),
+    "fast": ("p1", "disabled"),
+    "hp": ("p1", "disabled"),
+}
+
+
+def nvenc_preset_flags(preset: object) -> List[str]:
+    """-preset/-tune/-multipass for NVENC from either a legacy name or p1-p7."""
+    name = str(preset).strip().lower()
+    # An explicit p1-p7 gets full-resolution two-pass: these are one-off asset
+    # encodes, so quality per bit matters more than encode speed.
+    p_name, multipass = _NVENC_LEGACY_PRESETS.get(name, (name, "fullres"))
+    if p_name not in {f"p{i}" for i in range(1, 8)}:
+        # Unknown to us; hand it to ffmpeg untouched and let it decide.
+        return ["-preset", str(preset)]
+    return ["-preset", p_name, "-tune", "hq", "-multipass", multipass]
+
+
 def ensure_dir(p: str):
-    if not os.path.isdir(p):
-        os.makedirs(p, exist_ok=True)
+    os.makedirs(p, exist_ok=True)
 
 
 def normalize_asset(src: str, dst: str, loudnorm: bool = True):
@@ -123,8 +166,7 @@ def normalize_asset(src: str, dst: str, loudnorm: bool = True):
             "2",
             "-movflags",
             "+faststart",
-            "-preset",
-            str(nvenc_preset),
+            *nvenc_preset_flags(nvenc_preset),
             "-loglevel",
             "error",
             "-stats",
@@ -192,8 +234,7 @@ def normalize_asset(src: str, dst: str, loudnorm: bool = True):
             "-shortest",
             "-movflags",
             "+faststart",
-            "-preset",
-            str(nvenc_preset),
+            *nvenc_preset_flags(nvenc_preset),
             "-loglevel",
             "error",
             "-stats",
@@ -203,32 +244,75 @@ def normalize_asset(src: str, dst: str, loudnorm: bool = True):
     return rc == 0, _err.decode("utf-8", errors="ignore")
 
 
+# Stream fields that must match across files for the concat demuxer to join them.
+_SIGNATURE_KEYS = (
+    "codec_type",
+    "codec_name",
+    "width",
+    "height",
+    "r_frame_rate",
+    "time_base",
+    "sample_rate",
+    "channels",
+)
+
+
+def stream_signature(path: str) -> Tuple[Tuple[str, ...], ...]:
+    """Codec/geometry/timing of every stream, as the concat demuxer sees it (no decode)."""
+    rc, out, _err = run(
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-show_entries",
+            "stream=" + ",".join(_SIGNATURE_KEYS),
+            "-of",
+            "json",
+            path,
+        ],
+        capture_stdout=True,
+    )
+    if rc != 0:
+        return ()
+    try:
+        streams = json.loads(out.decode("utf-8", errors="ignore")).get("streams") or []
+    except ValueError:
+        return ()
+    return tuple(tuple(str(st.get(k, "")) for k in _SIGNATURE_KEYS) for st in streams)
+
+
 def build_concat_and_check(norm_dir: str, names: List[str]) -> Tuple[bool, str]:
-    """Create a concat list that walks through normalized names with statics between where available; audio-only decode check."""
+    """Create a concat list that walks through normalized names with statics between where available; audio-only decode check.
+
+    This goes through the concat *demuxer*, which joins files without
+    re-encoding -- but only when every file has identical stream parameters.
+    That is checked first with ffprobe (cheap, no decoding); a mismatch is
+    reported straight away instead of surfacing as decode errors. The audio
+    is then decoded across the joins, since AAC boundary glitches only show
+    up in the decoder (a ``-c copy`` pass would never see them).
+    """
+    sigs = {n: stream_signature(os.path.join(norm_dir, n)) for n in names}
+    reference = sigs[names[0]] if names else ()
+    mismatched = [n for n in names if sigs[n] != reference]
+    if mismatched:
+        return False, (
+            f"Stream parameters differ from {names[0]}: "
+            + ", ".join(mismatched)
+            + " (re-run with --normalize --rebuild)"
+        )
     concat_path = os.path.join(cache, "trans_test_concat")
     static_name = "static.mp4"
-    lines: List[str] = []
-
-    def _add(n: str):
-        lines.append(f"file _trans/{n}")
 
     # simple ordering: intros -> static -> others -> static -> outros
     intros = [n for n in names if n.lower().startswith("intro")]
     outros = [n for n in names if n.lower().startswith("outro")]
     static_present = static_name in set(names)
     others = [n for n in names if n not in intros + outros]
-    for n in intros:
-        _add(n)
-        if static_present:
-            _add(static_name)
-    for n in others:
-        _add(n)
-        if static_present:
-            _add(static_name)
-    for n in outros:
-        _add(n)
-    with open(concat_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    gap = [static_name] if static_present else []
+    ordered_names = [x for n in intros + others for x in (n, *gap)] + outros
+    # Binary + explicit encoding: no newline translation, and one buffered write.
+    with open(concat_path, "wb", buffering=1 << 16) as f:
+        f.writelines(f"file _trans/{n}\n".encode("utf-8") for n in ordered_names)
     rc, _out, _err = run(
         [
             ffmpeg,
@@ -247,8 +331,8 @@ def build_concat_and_check(norm_dir: str, names: List[str]) -> Tuple[bool, str]:
             "-",
         ]
     )
-    ok = rc == 0 and _err.decode("utf-8", errors="ignore").strip() == ""
-    return ok, _err.decode("utf-8", errors="ignore")
+    err = _err.decode("utf-8", errors="ignore")
+    return rc == 0 and err.strip() == "", err
 
 
 def main():
@@ -262,6 +346,17 @@ def main():
     ap.add_argument(
         "--no-audnorm", action="store_true", help="Disable loudness normalization when normalizing"
     )
+    ap.add_argument(
+        "--deep-check",
+        action="store_true",
+        help="Decode every frame when probing (slow) instead of only demuxing",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=2,
+        help="Concurrent NVENC encodes when normalizing (default 2; lower it if VRAM runs out)",
+    )
     ap.add_argument(
         "--concat-audio-check",
         action="store_true",
@@ -271,18 +366,31 @@ def main():
 
     tdir = resolve_transitions_dir()
     log("Transitions dir: " + tdir, 1)
-    files = [f for f in os.listdir(tdir) if f.lower().endswith(".mp4")]
-    files.sort()
+    # scandir hands back the joined path and the file type with each entry.
+    with os.scandir(tdir) as it:
+        entries = sorted(
+            (e for e in it if e.is_file() and e.name.lower().endswith(".mp4")),
+            key=lambda e: e.name,
+        )
+    files = [e.name for e in entries]
     if not files:
         log("No .mp4 files found in transitions directory", 1)
         return 0
 
+    # Stream copy is enough to prove the file demuxes; full decoding is opt-in.
+    check = decode_check if args.deep_check else muxcheck
+
+    def _probe(entry: os.DirEntry) -> Tuple[str, bool, bool, str]:
+        return (entry.name, probe_has_audio(entry.path), *check(entry.path))
+
+    # Each probe is two ffprobe/ffmpeg subprocesses; overlap them across files.
+    # ex.map keeps results in file order, so the log reads the same as before.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        results = list(ex.map(_probe, entries))
+
     ok_count = 0
     fail_count = 0
-    for name in files:
-        p = os.path.join(tdir, name)
-        has_aud = probe_has_audio(p)
-        ok, err = decode_check(p)
+    for name, has_aud, ok, err in results:
         status = "OK" if ok else "FAILED"
         aud = "audio" if has_aud else "no-audio"
         if ok:
@@ -299,21 +407,31 @@ def main():
     ensure_dir(norm_dir)
     normalized_ok: List[str] = []
     if args.normalize or args.concat_audio_check:
-        for name in files:
-            src = os.path.join(tdir, name)
-            dst = os.path.join(norm_dir, name)
-            if (not args.rebuild) and os.path.exists(dst):
-                normalized_ok.append(name)
-                log("Normalized exists: " + name, 1)
-                continue
-            ok, err = normalize_asset(src, dst, loudnorm=(not args.no_audnorm))
-            if ok:
-                normalized_ok.append(name)
-                log("Normalized: " + name, 1)
+        todo: List[os.DirEntry] = []
+        for entry in entries:
+            if (not args.rebuild) and os.path.exists(os.path.join(norm_dir, entry.name)):
+                normalized_ok.append(entry.name)
+                log("Normalized exists: " + entry.name, 1)
             else:
-                log("WARN Failed to normalize: " + name, 2)
-                if err:
-                    log(err, 5)
+                todo.append(entry)
+
+        def _normalize(entry: os.DirEntry) -> Tuple[bool, str]:
+            # entry.path is the same key the probe pass cached has-audio under.
+            dst = os.path.join(norm_dir, entry.name)
+            return normalize_asset(entry.path, dst, loudnorm=(not args.no_audnorm))
+
+        # NVENC runs a few encodes side by side; --jobs caps the sessions.
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as ex:
+            for name, (ok, err) in zip((e.name for e in todo), ex.map(_normalize, todo)):
+                if ok:
+                    normalized_ok.append(name)
+                    log("Normalized: " + name, 1)
+                else:
+                    log("WARN Failed to normalize: " + name, 2)
+                    if err:
+                        log(err, 5)
+        # Keep the concat order independent of which encodes were skipped.
+        normalized_ok.sort()
 
     # Concat audio-only decode check over normalized assets
     if args.concat_audio_check and normalized_ok:
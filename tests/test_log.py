@@ -0,0 +1,150 @@
+"""Tests for clippy.log's ClippyFormatter."""
+
+from __future__ import annotations
+
+import io
+import logging
+from types import SimpleNamespace
+
+import clippy.log as clippy_log
+from clippy.log import _CLIPPY_SUBLEVEL, ClippyFormatter
+
+
+def _record(msg: str, sublevel: int, levelno: int = logging.INFO) -> logging.LogRecord:
+    record = logging.LogRecord("clippy", levelno, __file__, 0, msg, None, None)
+    setattr(record, _CLIPPY_SUBLEVEL, sublevel)
+    return record
+
+
+class TestPlainOutput:
+    def test_prefix_per_sublevel(self):
+        fmt = ClippyFormatter(color=False)
+        assert fmt.format(_record("info", 0)) == "  info"
+        assert fmt.format(_record("step", 1)) == "• step"
+        assert fmt.format(_record("detail", 2)) == "› detail"
+        assert fmt.format(_record("boom", 5)) == "✖ boom"
+
+    def test_error_level_gets_the_cross(self):
+        fmt = ClippyFormatter(color=False)
+        assert fmt.format(_record("boom", 0, logging.ERROR)) == "✖ boom"
+
+    def test_message_is_left_untouched(self):
+        """No label/value restyling or arrow substitution in a log file."""
+        fmt = ClippyFormatter(color=False)
+        assert fmt.format(_record("Output: a -> b.mp4", 1)) == "• Output: a -> b.mp4"
+
+    def test_no_color_env_turns_off_styling(self, monkeypatch):
+        monkeypatch.setenv("NO_COLOR", "1")
+        fmt = ClippyFormatter(color=True)
+        assert fmt.format(_record("Output: x", 2)) == "› Output: x"
+
+
+class TestMinLevel:
+    def test_env_value_is_parsed_leniently(self, monkeypatch):
+        monkeypatch.setenv("CLIPPY_LOG_LEVEL", "2")
+        assert clippy_log._env_min_level() == 2
+        monkeypatch.setenv("CLIPPY_LOG_LEVEL", "loud")
+        assert clippy_log._env_min_level() == 0
+        monkeypatch.delenv("CLIPPY_LOG_LEVEL")
+        assert clippy_log._env_min_level() == 0
+
+    def test_calls_below_the_minimum_are_dropped(self, monkeypatch):
+        seen: list[str] = []
+
+        class _Collect(logging.Handler):
+            def emit(self, record):
+                seen.append(record.getMessage())
+
+        logger = clippy_log.get_logger()
+        handler = _Collect()
+        logger.addHandler(handler)
+        calls = (("chatter", 0), ("step", 1), ("detail", 2), ("boom", 5))
+        try:
+            monkeypatch.setattr(clippy_log, "_MIN_LEVEL", 2)
+            for msg, level in calls:
+                clippy_log.log(msg, level)
+            assert seen == ["detail", "boom"]
+            seen.clear()
+            monkeypatch.setattr(clippy_log, "_MIN_LEVEL", 9)
+            for msg, level in calls:
+                clippy_log.log(msg, level)
+            assert seen == ["boom"]
+        finally:
+            logger.removeHandler(handler)
+
+
+class TestBufferedHandler:
+    def _handler(self, **kwargs) -> tuple[io.StringIO, logging.Handler]:
+        stream = io.StringIO()
+        handler = clippy_log._BufferedStreamHandler(stream, max_delay=3600, **kwargs)
+        handler.setFormatter(ClippyFormatter(color=False))
+        return stream, handler
+
+    def test_info_lines_wait_for_the_next_step(self):
+        stream, handler = self._handler()
+        handler.handle(_record("one", 0))
+        handler.handle(_record("two", 0))
+        assert stream.getvalue() == ""
+        handler.handle(_record("step", 1))
+        assert stream.getvalue() == "  one\n  two\n\u2022 step\n"
+
+    def test_size_cap_and_explicit_flush(self):
+        stream, handler = self._handler(max_bytes=10)
+        handler.handle(_record("short", 0))
+        assert stream.getvalue() == ""
+        handler.handle(_record("long enough", 0))
+        assert stream.getvalue() == "  short\n  long enough\n"
+        handler.handle(_record("tail", 0))
+        handler.flush()
+        assert stream.getvalue().endswith("  tail\n")
+
+    def test_write_errors_go_to_handle_error(self, monkeypatch):
+        class _ClosedPipe(io.StringIO):
+            def write(self, s):
+                raise BrokenPipeError
+
+        handler = clippy_log._BufferedStreamHandler(_ClosedPipe())
+        handler.setFormatter(ClippyFormatter(color=False))
+        failed: list[logging.LogRecord] = []
+        monkeypatch.setattr(handler, "handleError", failed.append)
+        record = _record("step", 1)
+        handler.handle(record)
+        assert failed == [record]
+
+
+class TestColorOutput:
+    def test_error_lines_are_styled_once_end_to_end(self, monkeypatch):
+        theme = SimpleNamespace(error=lambda s: f"<e>{s}</e>")
+        monkeypatch.setattr(clippy_log, "_THEME", theme)
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        fmt = ClippyFormatter(color=True)
+        assert fmt.format(_record("Output: a -> b", 5)) == "<e>\u2716</e> <e>Output: a -> b</e>"
+
+    def test_prestyled_messages_pass_through(self, monkeypatch):
+        theme = SimpleNamespace(symbol=lambda s: f"<s>{s}</s>", text=lambda s: f"<t>{s}</t>")
+        monkeypatch.setattr(clippy_log, "_THEME", theme)
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        fmt = ClippyFormatter(color=True)
+        assert fmt.format(_record("\x1b[1mbold\x1b[0m", 1)) == "<s>\u2022</s> \x1b[1mbold\x1b[0m"
+
+    def test_refresh_theme_picks_up_a_swapped_theme(self, monkeypatch):
+        import clippy.theme
+
+        def _theme(tag: str) -> SimpleNamespace:
+            return SimpleNamespace(symbol=lambda s: f"<{tag}>{s}", text=lambda s: f"<{tag}t>{s}")
+
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        fmt = ClippyFormatter(color=True)
+        try:
+            for tag in ("a", "b"):
+                monkeypatch.setattr(clippy.theme, "THEME", _theme(tag))
+                clippy_log.refresh_theme()
+                assert fmt.format(_record("\x1b[0mx", 2)).startswith(f"<{tag}>\u203a ")
+                out = fmt.format(_record("Label: value -> x", 1))
+                assert out.startswith(f"<{tag}>\u2022 <{tag}t>Label")
+                assert f"<{tag}>\u2192" in out
+                other = "b" if tag == "a" else "a"
+                assert f"<{other}" not in out
+        finally:
+            monkeypatch.undo()
+            clippy_log.refresh_theme()
@@ -3,10 +3,22 @@
 from __future__ import annotations
 
 import dataclasses
+from types import SimpleNamespace
 
 import clippy.config as cfg
+import clippy.utils as utils
 from clippy.models import ClippyConfig
-from clippy.utils import discover_transition_files, resolve_transition_pool
+from clippy.utils import (
+    clear_transition_cache,
+    discover_transition_files,
+    find_transition_file,
+    fix_ascii,
+    fix_ascii_many,
+    refresh_config,
+    replace_vars,
+    resolve_transition_pool,
+    resolve_transitions_dir,
+)
 
 
 class TestTransitionResolver:
@@ -52,3 +64,163 @@ class TestTransitionResolver:
             "transition_01.mp4",
             "transition_03.mp4",
         ]
+
+    def test_resolve_transitions_dir_follows_config_changes(self, tmp_path, monkeypatch):
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        monkeypatch.delenv("TRANSITIONS_DIR", raising=False)
+
+        monkeypatch.setattr(cfg, "transitions_dir", str(first), raising=False)
+        assert resolve_transitions_dir() == str(first)
+        # The lookup is cached, but a new override must not get the old answer.
+        monkeypatch.setattr(cfg, "transitions_dir", str(second), raising=False)
+        assert resolve_transitions_dir() == str(second)
+
+    def test_find_transition_file_misses_are_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TRANSITIONS_DIR", str(tmp_path))
+        assert find_transition_file("late_asset.mp4") is None
+        (tmp_path / "late_asset.mp4").write_text("", encoding="utf-8")
+        assert find_transition_file("late_asset.mp4") == str(tmp_path / "late_asset.mp4")
+
+    def test_clear_transition_cache_forgets_moved_assets(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TRANSITIONS_DIR", str(tmp_path))
+        asset = tmp_path / "moved.mp4"
+        asset.write_text("", encoding="utf-8")
+        assert find_transition_file("moved.mp4") == str(asset)
+        asset.unlink()
+        clear_transition_cache()
+        assert find_transition_file("moved.mp4") is None
+
+
+class TestReplaceVars:
+    def test_substitutes_known_placeholders_and_keeps_others(self):
+        out = replace_vars("{cache}/{message_id}/{unknown}.{ext}", ("abc", 0, "someone"))
+        cache = cfg.get_config().paths.cache
+        assert out == f"{cache}/abc/{{unknown}}.{cfg.get_config().encoding.container_ext}"
+
+    def test_follows_set_config(self):
+        live = cfg.get_config()
+        assert replace_vars("{fps}", ("abc", 0, "")) == live.encoding.fps
+        cfg.set_config(
+            dataclasses.replace(live, encoding=dataclasses.replace(live.encoding, fps="24"))
+        )
+        assert replace_vars("{fps}", ("abc", 0, "")) == "24"
+
+    def test_refresh_config_picks_up_in_place_edits(self):
+        # A private copy, so the in-place edit can't leak into the shared config.
+        live = cfg.get_config()
+        cfg.set_config(dataclasses.replace(live, encoding=dataclasses.replace(live.encoding)))
+        own = cfg.get_config()
+        assert replace_vars("{fps}", ("abc", 0, "")) == own.encoding.fps
+        own.encoding.fps = "25"
+        refresh_config()
+        assert replace_vars("{fps}", ("abc", 0, "")) == "25"
+
+    def test_fontfile_uses_forward_slashes(self):
+        live = cfg.get_config()
+        font = "C:\\Windows\\Fonts\\custom-font.ttf"
+        cfg.set_config(
+            dataclasses.replace(live, assets=dataclasses.replace(live.assets, fontfile=font))
+        )
+        assert replace_vars("fontfile='{fontfile}'", ("abc", 0, "")) == (
+            "fontfile='C:/Windows/Fonts/custom-font.ttf'"
+        )
+
+    def test_compiled_template_is_reused_across_clips(self):
+        tmpl = "{message_id}/clip.{ext}|{author}"
+        ext = cfg.get_config().encoding.container_ext
+        assert replace_vars(tmpl, ("a", 0, "x")) == f"a/clip.{ext}|x"
+        assert replace_vars(tmpl, ("b", 0, "y")) == f"b/clip.{ext}|y"
+        assert replace_vars("no placeholders", ("c", 0, "")) == "no placeholders"
+
+    def test_substituted_values_are_not_rescanned(self):
+        out = replace_vars("text='{author}'", ("abc", 0, "it's {bitrate}"))
+        assert out == "text='it\\'s {bitrate}'"
+
+
+class TestFixAscii:
+    def test_keeps_letters_digits_and_spaces_only(self):
+        assert fix_ascii("Caf\u00e9 n\u00b01: h\u00e9llo_w\u00f6rld!") == "Caf n1 hllowrld"
+
+    def test_coerces_non_strings(self):
+        assert fix_ascii(42) == "42"
+
+    def test_ascii_input_drops_punctuation_and_controls(self):
+        assert fix_ascii("Some_Title: #2!\t(ok)") == "SomeTitle 2ok"
+
+    def test_many_matches_single(self):
+        names = ["Caf\u00e9", "x_Q_c", 7, ""]
+        assert fix_ascii_many(names) == [fix_ascii(n) for n in names]
+
+
+class TestAccentSymbols:
+    def test_accents_each_standalone_symbol_once(self, monkeypatch):
+        monkeypatch.setattr(utils, "THEME", SimpleNamespace(symbol=lambda s: f"[{s}]"))
+        out = utils._accent_symbols("a -> b : c * d \u2192 e -> : f")
+        assert out == "a [\u2192] b [:] c [*] d [\u2192] e [\u2192] [:] f"
+
+    def test_unspaced_symbols_are_left_alone(self, monkeypatch):
+        monkeypatch.setattr(utils, "THEME", SimpleNamespace(symbol=lambda s: f"[{s}]"))
+        assert utils._accent_symbols("a->b key: value 2*3") == "a->b key: value 2*3"
+
+    def test_no_theme_leaves_text_unchanged(self, monkeypatch):
+        monkeypatch.setattr(utils, "THEME", None)
+        utils.invalidate_theme_cache()
+        assert utils._accent_symbols("a -> b : c") == "a -> b : c"
+
+
+class TestLooksLikePath:
+    def test_paths(self):
+        for v in ("C:\\Clippy\\bin", "d:/clips", "output/foo.mp4", "  clip.MP4 ", "notes.txt"):
+            assert utils._looks_like_path(v), v
+
+    def test_not_paths(self):
+        for v in ("", "12", "Guild Name / #channel", "C:", "a \\ b"):
+            assert not utils._looks_like_path(v), v
+
+
+class TestStyleLabelValue:
+    @staticmethod
+    def _theme(tag: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            text=lambda s: f"<t>{s}",
+            label=lambda s: f"<{tag}>{s}",
+            value=lambda s: f"<v>{s}",
+            path=lambda s: f"<p>{s}",
+            symbol=lambda s: f"[{s}]",
+        )
+
+    def test_splits_label_and_value(self, monkeypatch):
+        monkeypatch.setattr(utils, "THEME", self._theme("l"))
+        assert utils._style_label_value("Clips: 12") == "<l>Clips [:] <v>12"
+        assert utils._style_label_value("Output: a/b.mp4") == "<l>Output [:] <p>a/b.mp4"
+        assert utils._style_label_value("no label") == "<t>no label"
+
+    def test_invalidate_picks_up_in_place_theme_edits(self, monkeypatch):
+        theme = self._theme("l")
+        monkeypatch.setattr(utils, "THEME", theme)
+        assert utils._style_label_value("A: b").startswith("<l>A")
+        theme.label = lambda s: f"<L2>{s}"
+        utils.invalidate_theme_cache()
+        assert utils._style_label_value("A: b").startswith("<L2>A")
+
+
+class TestPrepWork:
+    def test_creates_dirs_and_keeps_existing_readmes(self, tmp_path, monkeypatch):
+        live = cfg.get_config()
+        paths = dataclasses.replace(
+            live.paths, cache=str(tmp_path / "cache"), output=str(tmp_path / "output")
+        )
+        cfg.set_config(dataclasses.replace(live, paths=paths))
+        transitions = tmp_path / "transitions"
+        transitions.mkdir()
+        (transitions / "README.md").write_text("mine", encoding="utf-8")
+        monkeypatch.setenv("TRANSITIONS_DIR", str(transitions))
+
+        utils.prep_work()
+
+        assert (tmp_path / "cache" / "README.md").read_text(encoding="utf-8").startswith("# cache")
+        assert (tmp_path / "output" / "README.md").is_file()
+        assert (transitions / "README.md").read_text(encoding="utf-8") == "mine"